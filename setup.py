@@ -22,6 +22,7 @@ tests_require = [
     'pytest>=3.0.1',
     'pytest-cov',
     'pytest-mock',
+    'pytest-xdist',
 ]
 
 dev_require = [
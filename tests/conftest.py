@@ -13,18 +13,43 @@ def bob_user():
     return {'name': 'bob'}
 
 
-@fixture
+@fixture(scope='session')
 def context_urls_all():
     from coalaip.context_urls import COALAIP, SCHEMA
     return [COALAIP, SCHEMA]
 
 
-@fixture
-def mock_plugin():
+@fixture(scope='session')
+def context_urls_all_frozen(context_urls_all):
+    # Precomputed for tests that only compare against the default
+    # context as a set
+    return frozenset(context_urls_all)
+
+
+@fixture(scope='session')
+def _plugin_template():
     from tests.utils import create_mock_plugin
     return create_mock_plugin()
 
 
+@fixture
+def mock_plugin(_plugin_template):
+    from unittest.mock import DEFAULT
+    # Hand every test the session-scoped plugin with call history and
+    # configured behaviour scrubbed (`reset_mock()` alone doesn't clear
+    # the method mocks' `return_value`s and `side_effect`s). Reusing the
+    # same instance keeps the entities cached by the persisted fixtures
+    # below bound to a compatible plugin across tests.
+    plugin = _plugin_template
+    plugin.reset_mock()
+    for method_name in ('generate_user', 'get_history', 'get_status',
+                        'is_same_user', 'load', 'save', 'transfer'):
+        method = getattr(plugin, method_name)
+        method.return_value = DEFAULT
+        method.side_effect = None
+    return plugin
+
+
 @fixture
 def mock_plugin_for_deriving_rights(mock_plugin, right_data,
                                     mock_right_create_id):
@@ -37,35 +62,49 @@ def mock_plugin_for_deriving_rights(mock_plugin, right_data,
     return mock_plugin
 
 
+@fixture
+def set_persist_ids(mock_plugin):
+    from tests.utils import create_entity_id_setter
+
+    # Factory for the common 'configure the ids that plugin.save() will
+    # return per entity' setup
+    def _set_persist_ids(work_id, manifestation_id, copyright_id,
+                         type_key='@type'):
+        mock_plugin.save.side_effect = create_entity_id_setter(
+            work_id, manifestation_id, copyright_id, type_key=type_key)
+
+    return _set_persist_ids
+
+
 @fixture
 def mock_coalaip(mock_plugin):
     from coalaip import CoalaIp
     return CoalaIp(mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_entity_status():
     return 'valid'
 
 
-@fixture
+@fixture(scope='session')
 def mock_entity_create_id():
     return 'mock_entity_create_id'
 
 
-@fixture
+@fixture(scope='session')
 def base_model():
     from coalaip.models import Model
     model = Model(data={}, ld_type='type')
     return model
 
 
-@fixture
+@fixture(scope='session')
 def mock_entity_type():
     return 'mock_entity_type'
 
 
-@fixture
+@fixture(scope='session')
 def mock_entity_context():
     return 'mock_entity_context'
 
@@ -100,21 +139,34 @@ def mock_transfer_error():
     return exception
 
 
-@fixture
-def work_data():
+@fixture(scope='session')
+def _work_data_template():
     return {
         'name': 'Title',
     }
 
 
 @fixture
-def work_jsonld(context_urls_all, work_data):
+def work_data(_work_data_template):
+    # Tests mutate the data they're given, so hand out copies of the
+    # session-scoped template
+    return dict(_work_data_template)
+
+
+@fixture(scope='session')
+def _work_jsonld_template(context_urls_all, _work_data_template):
     ld_data = {
         '@context': context_urls_all,
         '@type': 'AbstractWork',
         '@id': '',
     }
-    return extend_dict(ld_data, work_data)
+    return extend_dict(ld_data, _work_data_template)
+
+
+@fixture
+def work_jsonld(_work_jsonld_template):
+    from copy import deepcopy
+    return deepcopy(_work_jsonld_template)
 
 
 @fixture
@@ -137,19 +189,27 @@ def work_entity(mock_plugin, work_data):
     return Work.from_data(work_data, plugin=mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_work_create_id():
     return 'mock_work_create_id'
 
 
-@fixture
+@fixture(scope='session')
 def manifestation_data_factory(mock_work_create_id):
-    def factory(*, manifestationOfWork=mock_work_create_id, data=None):
-        manifestation_data = {
-            'name': 'Title',
-            'creator': 'https://ipdb.foundation/api/transactions/12346789',
-            'manifestationOfWork': manifestationOfWork
-        }
+    # The template is built once per session; each call spreads it into
+    # a fresh dict instead of reconstructing the literal
+    template = {
+        'name': 'Title',
+        'creator': 'https://ipdb.foundation/api/transactions/12346789',
+        'manifestationOfWork': mock_work_create_id,
+    }
+
+    def factory(*, manifestationOfWork=mock_work_create_id, data=None,
+                exclude=()):
+        manifestation_data = {**template,
+                              'manifestationOfWork': manifestationOfWork}
+        for key in exclude:
+            del manifestation_data[key]
         return extend_dict(manifestation_data, data)
 
     return factory
@@ -161,16 +221,24 @@ def manifestation_data(manifestation_data_factory):
 
 
 @fixture
+def manifestation_data_no_work(manifestation_data_factory):
+    # Manifestation data without a 'manifestationOfWork', for tests that
+    # register (or fail to register) a Work alongside the Manifestation
+    return manifestation_data_factory(exclude=('manifestationOfWork',))
+
+
+@fixture(scope='session')
 def manifestation_jsonld_factory(context_urls_all, manifestation_data_factory):
+    ld_template = {
+        '@context': context_urls_all,
+        '@type': 'CreativeWork',
+        '@id': '',
+    }
+
     def factory(**kwargs):
-        ld_data = {
-            '@context': context_urls_all,
-            '@type': 'CreativeWork',
-            '@id': '',
-        }
-        return extend_dict(
-            ld_data,
-            manifestation_data_factory(**kwargs))
+        # extend_dict copies its first argument, so the shared template
+        # is never mutated
+        return extend_dict(ld_template, manifestation_data_factory(**kwargs))
 
     return factory
 
@@ -180,15 +248,14 @@ def manifestation_jsonld(manifestation_jsonld_factory):
     return manifestation_jsonld_factory()
 
 
-@fixture
+@fixture(scope='session')
 def manifestation_json_factory(manifestation_data_factory):
+    json_template = {
+        'type': 'CreativeWork',
+    }
+
     def factory(**kwargs):
-        json_data = {
-            'type': 'CreativeWork',
-        }
-        return extend_dict(
-            json_data,
-            manifestation_data_factory(**kwargs))
+        return extend_dict(json_template, manifestation_data_factory(**kwargs))
 
     return factory
 
@@ -210,18 +277,15 @@ def manifestation_entity(mock_plugin, manifestation_data):
     return Manifestation.from_data(manifestation_data, plugin=mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_manifestation_create_id():
     return 'mock_manifestation_create_id'
 
 
-@fixture
+@fixture(scope='session')
 def copyright_data_factory(mock_manifestation_create_id):
     def factory(*, rightsOf=mock_manifestation_create_id, data=None):
-        copyright_data = {
-            'rightsOf': rightsOf
-        }
-        return extend_dict(copyright_data, data)
+        return extend_dict({'rightsOf': rightsOf}, data)
     return factory
 
 
@@ -230,15 +294,16 @@ def copyright_data(copyright_data_factory):
     return copyright_data_factory()
 
 
-@fixture
+@fixture(scope='session')
 def copyright_jsonld_factory(context_urls_all, copyright_data_factory):
+    ld_template = {
+        '@context': context_urls_all,
+        '@type': 'Copyright',
+        '@id': '',
+    }
+
     def factory(**kwargs):
-        ld_data = {
-            '@context': context_urls_all,
-            '@type': 'Copyright',
-            '@id': '',
-        }
-        return extend_dict(ld_data, copyright_data_factory(**kwargs))
+        return extend_dict(ld_template, copyright_data_factory(**kwargs))
     return factory
 
 
@@ -247,13 +312,14 @@ def copyright_jsonld(copyright_jsonld_factory):
     return copyright_jsonld_factory()
 
 
-@fixture
+@fixture(scope='session')
 def copyright_json_factory(copyright_data_factory):
+    json_template = {
+        'type': 'Copyright',
+    }
+
     def factory(**kwargs):
-        json_data = {
-            'type': 'Copyright',
-        }
-        return extend_dict(json_data, copyright_data_factory(**kwargs))
+        return extend_dict(json_template, copyright_data_factory(**kwargs))
     return factory
 
 
@@ -274,19 +340,20 @@ def copyright_entity(mock_plugin, copyright_data):
     return Copyright.from_data(copyright_data, plugin=mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_copyright_create_id():
     return 'mock_copyright_create_id'
 
 
-@fixture
+@fixture(scope='session')
 def right_data_factory(mock_license_url, mock_copyright_create_id):
+    template = {
+        'source': mock_copyright_create_id,
+        'license': mock_license_url,
+    }
+
     def factory(*, source=mock_copyright_create_id, data=None):
-        right_data = {
-            'source': source,
-            'license': mock_license_url
-        }
-        return extend_dict(right_data, data)
+        return extend_dict({**template, 'source': source}, data)
     return factory
 
 
@@ -295,15 +362,16 @@ def right_data(right_data_factory):
     return right_data_factory()
 
 
-@fixture
+@fixture(scope='session')
 def right_jsonld_factory(context_urls_all, right_data_factory):
+    ld_template = {
+        '@context': context_urls_all,
+        '@type': 'Right',
+        '@id': '',
+    }
+
     def factory(**kwargs):
-        ld_data = {
-            '@context': context_urls_all,
-            '@type': 'Right',
-            '@id': '',
-        }
-        return extend_dict(ld_data, right_data_factory(**kwargs))
+        return extend_dict(ld_template, right_data_factory(**kwargs))
     return factory
 
 
@@ -312,13 +380,14 @@ def right_jsonld(right_jsonld_factory):
     return right_jsonld_factory()
 
 
-@fixture
+@fixture(scope='session')
 def right_json_factory(right_data_factory):
+    json_template = {
+        'type': 'Right',
+    }
+
     def factory(**kwargs):
-        json_data = {
-            'type': 'Right',
-        }
-        return extend_dict(json_data, right_data_factory(**kwargs))
+        return extend_dict(json_template, right_data_factory(**kwargs))
     return factory
 
 
@@ -339,17 +408,17 @@ def right_entity(mock_plugin, right_data):
     return Right.from_data(right_data, plugin=mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_right_create_id():
     return 'mock_right_create_id'
 
 
-@fixture
+@fixture(scope='session')
 def mock_license_url():
     return 'https://ipdb.s3.amazonaws.com/mock_license.pdf'
 
 
-@fixture
+@fixture(scope='session')
 def mock_transfer_contract_url():
     return 'https://ipdb.s3.amazonaws.com/mock_transfer_contract.pdf'
 
@@ -392,53 +461,70 @@ def rights_assignment_entity(mock_plugin, rights_assignment_data):
                                       plugin=mock_plugin)
 
 
-@fixture
+@fixture(scope='session')
 def mock_rights_assignment_transfer_id():
     return 'mock_rights_assignment_transfer_id'
 
 
+@fixture(scope='session')
+def _persisted_entity_cache():
+    # Cache for the results of the expensive end-to-end registration
+    # fixtures below. The cached entities stay bound to the
+    # session-scoped plugin and are only ever read by tests, so they
+    # can safely be shared.
+    return {}
+
+
 @fixture
-def persisted_jsonld_registration(mock_plugin, mock_coalaip,
-                                  manifestation_data, alice_user,
-                                  mock_work_create_id,
+def persisted_jsonld_registration(_persisted_entity_cache, mock_plugin,
+                                  mock_coalaip, manifestation_data,
+                                  alice_user, mock_work_create_id,
                                   mock_manifestation_create_id,
                                   mock_copyright_create_id):
     from tests.utils import create_entity_id_setter
 
-    # Remove the 'manifestationOfWork' key to also register a new Work
-    del manifestation_data['manifestationOfWork']
+    if 'registration' not in _persisted_entity_cache:
+        # Remove the 'manifestationOfWork' key to also register a new Work
+        del manifestation_data['manifestationOfWork']
+
+        # Set the persisted ids of the entities
+        mock_plugin.save.side_effect = create_entity_id_setter(
+            mock_work_create_id,
+            mock_manifestation_create_id,
+            mock_copyright_create_id)
 
-    # Set the persisted ids of the entities
-    mock_plugin.save.side_effect = create_entity_id_setter(
-        mock_work_create_id,
-        mock_manifestation_create_id,
-        mock_copyright_create_id)
+        register_result = mock_coalaip.register_manifestation(
+            manifestation_data,
+            copyright_holder=alice_user,
+        )
 
-    register_result = mock_coalaip.register_manifestation(
-        manifestation_data,
-        copyright_holder=alice_user,
-    )
+        # Reset mock for later users
+        mock_plugin.save.reset_mock()
+        mock_plugin.save.side_effect = None
+        _persisted_entity_cache['registration'] = register_result
 
-    # Reset mock for later users
-    mock_plugin.save.reset_mock()
-    mock_plugin.save.side_effect = None
-    return register_result
+    return _persisted_entity_cache['registration']
 
 
 @fixture
-def persisted_jsonld_derived_right(mock_plugin_for_deriving_rights,
+def persisted_jsonld_derived_right(_persisted_entity_cache,
+                                   mock_plugin_for_deriving_rights,
                                    mock_coalaip, alice_user,
                                    persisted_jsonld_registration, right_data,
                                    mock_right_create_id):
-    copyright_ = persisted_jsonld_registration.copyright
-    # Remove the 'source' key to use the persisted copyright
-    del right_data['source']
-
-    mock_plugin_for_deriving_rights.save.return_value = 'asdf'
-    right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                      source_right=copyright_)
-
-    # Reset mock for later users
-    mock_plugin_for_deriving_rights.save.reset_mock()
-    mock_plugin_for_deriving_rights.save.return_value = None
-    return right
+    if 'derived_right' not in _persisted_entity_cache:
+        copyright_ = persisted_jsonld_registration.copyright
+        # Remove the 'source' key to use the persisted copyright
+        del right_data['source']
+
+        mock_plugin_for_deriving_rights.save.return_value = 'asdf'
+        right = mock_coalaip.derive_right(right_data,
+                                          current_holder=alice_user,
+                                          source_right=copyright_)
+
+        # Reset mock for later users
+        mock_plugin_for_deriving_rights.save.reset_mock()
+        mock_plugin_for_deriving_rights.save.return_value = None
+        _persisted_entity_cache['derived_right'] = right
+
+    return _persisted_entity_cache['derived_right']
@@ -1,6 +1,35 @@
 #!/usr/bin/env python
 
-from pytest import mark, raises
+import operator
+
+from unittest.mock import call
+
+from pytest import mark, param, raises
+
+from coalaip.data_formats import DataFormat
+
+
+# Dispatches a `data_format` to the entity serialization it should have
+# persisted with ('jsonld' is the default format)
+_SERIALIZE = {
+    None: operator.methodcaller('to_jsonld'),
+    '': operator.methodcaller('to_jsonld'),
+    'json': operator.methodcaller('to_json'),
+    'jsonld': operator.methodcaller('to_jsonld'),
+}
+
+# All accepted `data_format` arguments (each format may be given as a
+# string or as a `DataFormat` member), covered on a single parametrize
+# axis instead of a `data_format` x `use_data_format_enum` product
+DATA_FORMAT_ARGS = [
+    param(None, id='default'),
+    param('json', id='json-str'),
+    param(DataFormat.json, id='json-enum'),
+    param('jsonld', id='jsonld-str'),
+    param(DataFormat.jsonld, id='jsonld-enum'),
+    param('ipld', id='ipld',
+          marks=mark.skip(reason='IPLD is not implemented yet')),
+]
 
 
 def test_coalaip_expects_plugin():
@@ -33,28 +62,25 @@ def test_generate_user(mock_plugin, mock_coalaip, alice_user):
 
 
 def test_register_manifestation_without_creating_work(mock_plugin,
-        mock_coalaip, manifestation_data, alice_user,
+        mock_coalaip, manifestation_data_no_work, alice_user,
         mock_manifestation_create_id):
     from tests.utils import (
         assert_key_values_present_in_dict,
     )
 
-    # Remove the 'manifestationOfWork' key to create a new Work
-    del manifestation_data['manifestationOfWork']
-
     manifestation_copyright, manifestation, work = mock_coalaip.register_manifestation( #noqa
-        manifestation_data,
+        manifestation_data_no_work,
         copyright_holder=alice_user,
         create_work=False,
         create_copyright=False
     )
 
     manifestation_persisted_data = manifestation.to_jsonld()
-    if manifestation_data:
+    if manifestation_data_no_work:
         assert_key_values_present_in_dict(manifestation_persisted_data,
-                                          **manifestation_data)
+                                          **manifestation_data_no_work)
         assert_key_values_present_in_dict(manifestation.data,
-                                          **manifestation_data)
+                                          **manifestation_data_no_work)
 
     assert manifestation_copyright is None
     assert work is None
@@ -63,51 +89,34 @@ def test_register_manifestation_without_creating_work(mock_plugin,
     # Test the entities were persisted with the set persisted ids
     assert manifestation.persist_id is not None
 
-    # Test the correct data format was persisted
-    manifestation_persisted_data = manifestation.to_jsonld()
-
     # Check we called plugin.save() with the correct data
-    mock_save_call_list = mock_plugin.save.call_args_list
-    assert len(mock_save_call_list) == 1
-    assert mock_save_call_list[0] == (
-        (manifestation_persisted_data,),
-        {'user': alice_user},
-    )
+    assert mock_plugin.save.call_args_list == [
+        call(manifestation_persisted_data, user=alice_user),
+    ]
 
 
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', [None, 'json', 'jsonld', mark.skip('ipld')])
-def test_register_manifestation(mock_plugin, mock_coalaip, manifestation_data,
-                                alice_user, data_format, use_data_format_enum,
+@mark.parametrize('data_format_arg', DATA_FORMAT_ARGS)
+def test_register_manifestation(mock_plugin, mock_coalaip, manifestation_data_no_work,
+                                alice_user, data_format_arg,
                                 mock_work_create_id,
                                 mock_manifestation_create_id,
-                                mock_copyright_create_id):
-    from tests.utils import create_entity_id_setter
-
-    # Remove the 'manifestationOfWork' key to create a new Work
-    del manifestation_data['manifestationOfWork']
+                                mock_copyright_create_id, set_persist_ids):
+    data_format = getattr(data_format_arg, 'value', data_format_arg)
 
     # Set the persisted ids of the entities
-    mock_plugin.save.side_effect = create_entity_id_setter(
-        mock_work_create_id,
-        mock_manifestation_create_id,
-        mock_copyright_create_id,
-        type_key='type' if data_format == 'json' else '@type',
-    )
+    set_persist_ids(mock_work_create_id,
+                    mock_manifestation_create_id,
+                    mock_copyright_create_id,
+                    type_key='type' if data_format == 'json' else '@type')
 
     # Set up the data format
     register_manifestation_kwargs = {}
-    if data_format:
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format_arg = get_data_format_enum_member(data_format)
-        else:
-            data_format_arg = data_format
+    if data_format_arg:
         register_manifestation_kwargs['data_format'] = data_format_arg
 
     # Create the entities and test they contain the right links
     manifestation_copyright, manifestation, work = mock_coalaip.register_manifestation(
-        manifestation_data,
+        manifestation_data_no_work,
         copyright_holder=alice_user,
         **register_manifestation_kwargs
     )
@@ -120,38 +129,23 @@ def test_register_manifestation(mock_plugin, mock_coalaip, manifestation_data,
     assert work.persist_id == mock_work_create_id
 
     # Test the correct data format was persisted
-    if data_format == 'json':
-        manifestation_persisted_data = manifestation.to_json()
-        copyright_persisted_data = manifestation_copyright.to_json()
-        work_persisted_data = work.to_json()
-    elif data_format == 'ipld':
-        raise NotImplementedError('IPLD is not implemented yet')
-    else:
-        manifestation_persisted_data = manifestation.to_jsonld()
-        copyright_persisted_data = manifestation_copyright.to_jsonld()
-        work_persisted_data = work.to_jsonld()
+    serialize = _SERIALIZE[data_format]
+    manifestation_persisted_data = serialize(manifestation)
+    copyright_persisted_data = serialize(manifestation_copyright)
+    work_persisted_data = serialize(work)
 
     # By checking we called plugin.save() in the right order
-    mock_save_call_list = mock_plugin.save.call_args_list
-    assert len(mock_save_call_list) == 3
-    assert mock_save_call_list[0] == (
-        (work_persisted_data,),
-        {'user': alice_user},
-    )
-    assert mock_save_call_list[1] == (
-        (manifestation_persisted_data,),
-        {'user': alice_user},
-    )
-    assert mock_save_call_list[2] == (
-        (copyright_persisted_data,),
-        {'user': alice_user},
-    )
+    assert mock_plugin.save.call_args_list == [
+        call(work_persisted_data, user=alice_user),
+        call(manifestation_persisted_data, user=alice_user),
+        call(copyright_persisted_data, user=alice_user),
+    ]
 
 
 def test_register_manifestation_with_work_id_in_data(
         mock_plugin, mock_coalaip, manifestation_data_factory, alice_user,
-        work_entity, mock_manifestation_create_id, mock_copyright_create_id):
-    from tests.utils import create_entity_id_setter
+        work_entity, mock_manifestation_create_id, mock_copyright_create_id,
+        set_persist_ids):
     ignored_work_entity = work_entity
     provided_work_id = 'provided_work_id'
 
@@ -162,11 +156,9 @@ def test_register_manifestation_with_work_id_in_data(
     })
 
     # Set the persisted ids of the entities
-    mock_plugin.save.side_effect = create_entity_id_setter(
-        None,  # No Work should be created
-        mock_manifestation_create_id,
-        mock_copyright_create_id,
-    )
+    set_persist_ids(None,  # No Work should be created
+                    mock_manifestation_create_id,
+                    mock_copyright_create_id)
 
     manifestation_copyright, manifestation, work = mock_coalaip.register_manifestation(
         manifestation_data,
@@ -198,29 +190,24 @@ def test_register_work(mock_plugin, mock_coalaip, manifestation_data,
     mock_plugin.save.assert_any_call(work_persisted_data, user=alice_user)
 
 
-@mark.parametrize('work_data', [None, {'name': 'mock_work_name'}])
 def test_register_manifestation_with_work_data(
-        mock_plugin, mock_coalaip, manifestation_data, alice_user, work_data,
+        mock_plugin, mock_coalaip, manifestation_data_no_work, alice_user,
         mock_work_create_id, mock_manifestation_create_id,
-        mock_copyright_create_id):
+        mock_copyright_create_id, set_persist_ids):
     from tests.utils import (
         assert_key_values_present_in_dict,
-        create_entity_id_setter
     )
-
-    # Remove the 'manifestationOfWork' key to create a new Work
-    del manifestation_data['manifestationOfWork']
+    # The no-work-data case is already covered by test_register_manifestation
+    work_data = {'name': 'mock_work_name'}
 
     # Set the persisted ids of the entities
-    mock_plugin.save.side_effect = create_entity_id_setter(
-        mock_work_create_id,
-        mock_manifestation_create_id,
-        mock_copyright_create_id,
-    )
+    set_persist_ids(mock_work_create_id,
+                    mock_manifestation_create_id,
+                    mock_copyright_create_id)
 
     # Create the entities
     manifestation_copyright, manifestation, work = mock_coalaip.register_manifestation(
-        manifestation_data,
+        manifestation_data_no_work,
         copyright_holder=alice_user,
         work_data=work_data,
     )
@@ -229,40 +216,32 @@ def test_register_manifestation_with_work_data(
 
     work_persisted_data = work.to_jsonld()
 
-    # If given custom Work information, make sure that it's reflected in the
-    # created Work
-    if work_data:
-        assert_key_values_present_in_dict(work_persisted_data, **work_data)
-        assert_key_values_present_in_dict(work.data, **work_data)
+    # Make sure the custom Work information is reflected in the created Work
+    assert_key_values_present_in_dict(work_persisted_data, **work_data)
+    assert_key_values_present_in_dict(work.data, **work_data)
 
     # Check we called plugin.save() with the correct data
     mock_plugin.save.assert_any_call(work_persisted_data, user=alice_user)
 
 
 def test_register_manifestation_with_existing_work(
-        mock_plugin, mock_coalaip, manifestation_data, alice_user,
+        mock_plugin, mock_coalaip, manifestation_data_no_work, alice_user,
         persisted_jsonld_registration, mock_manifestation_create_id,
-        mock_copyright_create_id):
-    from tests.utils import create_entity_id_setter
-
+        mock_copyright_create_id, set_persist_ids):
     new_manifestation_create_id = mock_manifestation_create_id + '2'
     new_copyright_create_id = mock_copyright_create_id + '2'
 
-    # Remove the 'manifestationOfWork' key to use the existing_work
-    del manifestation_data['manifestationOfWork']
-
     # Set the persisted ids of the entities
-    mock_plugin.save.side_effect = create_entity_id_setter(
-        None,  # No work is created
-        new_manifestation_create_id,
-        new_copyright_create_id,
-    )
+    set_persist_ids(None,  # No work is created
+                    new_manifestation_create_id,
+                    new_copyright_create_id)
 
     # Test the new Manifestation is created with the given existing_work (and
-    # ignores any given work_data)
-    mock_plugin.reset_mock()  # Reset call counts on the mock from before
+    # ignores any given work_data). No reset_mock() is needed here: the
+    # mock_plugin fixture hands out the plugin with a clean call history
+    # and the persisted registration fixture leaves no recorded calls.
     new_manifestation_copyright, new_manifestation, old_work = mock_coalaip.register_manifestation(
-        manifestation_data,
+        manifestation_data_no_work,
         copyright_holder=alice_user,
         existing_work=persisted_jsonld_registration.work,
         work_data={'ignored': 'ignored'},
@@ -279,47 +258,37 @@ def test_register_manifestation_with_existing_work(
 
     # Check we called plugin.save() twice (only saving the Manifestation and
     # Copyright) and in the right order
-    mock_save_call_list = mock_plugin.save.call_args_list
-    assert len(mock_save_call_list) == 2
-    assert mock_save_call_list[0] == (
-        (new_manifestation.to_jsonld(),),
-        {'user': alice_user},
-    )
-    assert mock_save_call_list[1] == (
-        (new_manifestation_copyright.to_jsonld(),),
-        {'user': alice_user},
-    )
+    new_manifestation_jsonld = new_manifestation.to_jsonld()
+    new_copyright_jsonld = new_manifestation_copyright.to_jsonld()
+    assert mock_plugin.save.call_args_list == [
+        call(new_manifestation_jsonld, user=alice_user),
+        call(new_copyright_jsonld, user=alice_user),
+    ]
 
 
 def test_register_manifestation_with_existing_work_raises_on_non_work(
-        mock_coalaip, alice_user, manifestation_data):
-    # Remove the 'manifestationOfWork' key to use the existing_work
-    del manifestation_data['manifestationOfWork']
-
+        mock_coalaip, alice_user, manifestation_data_no_work):
     with raises(TypeError):
         mock_coalaip.register_manifestation(
-            manifestation_data,
+            manifestation_data_no_work,
             copyright_holder=alice_user,
             existing_work={},
         )
 
 
 def test_register_manifestation_with_existing_work_raises_on_not_persisted_work(
-        mock_coalaip, alice_user, manifestation_data, work_entity):
+        mock_coalaip, alice_user, manifestation_data_no_work, work_entity):
     from coalaip.exceptions import EntityNotYetPersistedError
-    # Remove the 'manifestationOfWork' key to use the existing_work
-    del manifestation_data['manifestationOfWork']
-
     with raises(EntityNotYetPersistedError):
         mock_coalaip.register_manifestation(
-            manifestation_data,
+            manifestation_data_no_work,
             copyright_holder=alice_user,
             existing_work=work_entity,
         )
 
 
 def test_register_manifestation_with_existing_work_raises_on_incompatible_plugin(
-        mock_coalaip, mock_plugin, alice_user, manifestation_data, work_data,
+        mock_coalaip, mock_plugin, alice_user, manifestation_data_no_work, work_data,
         mock_work_create_id):
     from coalaip.entities import Work
     from coalaip.exceptions import IncompatiblePluginError
@@ -332,12 +301,9 @@ def test_register_manifestation_with_existing_work_raises_on_incompatible_plugin
     mock_plugin.save.return_value = mock_work_create_id
     existing_work_from_diff_plugin.create(user=alice_user)
 
-    # Remove the 'manifestationOfWork' key to use the existing_work
-    del manifestation_data['manifestationOfWork']
-
     with raises(IncompatiblePluginError):
         mock_coalaip.register_manifestation(
-            manifestation_data,
+            manifestation_data_no_work,
             copyright_holder=alice_user,
             existing_work=existing_work_from_diff_plugin,
         )
@@ -354,195 +320,180 @@ def test_register_manifestation_raises_on_creation_error(
                                             copyright_holder=alice_user)
 
 
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', [None, 'json', 'jsonld', mark.skip('ipld')])
-def test_derive_right(mock_plugin_for_deriving_rights, mock_coalaip,
-                      right_data, alice_user, data_format,
-                      use_data_format_enum, mock_right_create_id):
-    derive_right_kwargs = {}
-    if data_format:
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format_arg = get_data_format_enum_member(data_format)
-        else:
-            data_format_arg = data_format
-        derive_right_kwargs['data_format'] = data_format_arg
-
-    # Create the Right and test it was persisted
-    right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                      **derive_right_kwargs)
-    assert right.persist_id == mock_right_create_id
-
-    # Test the correct data format was persisted
-    if data_format == 'json':
-        right_persisted_data = right.to_json()
-    elif data_format == 'ipld':
-        raise NotImplementedError('IPLD is not implemented yet')
-    else:
+class TestDeriveRight:
+    """Groups the derive_right tests so distributed runs (e.g.
+    pytest-xdist's loadscope scheduling) keep them, and their shared
+    plugin setup, on a single worker.
+    """
+
+    @mark.parametrize('data_format_arg', DATA_FORMAT_ARGS)
+    def test_derive_right(self, mock_plugin_for_deriving_rights,
+                          mock_coalaip, right_data, alice_user,
+                          data_format_arg, mock_right_create_id):
+        data_format = getattr(data_format_arg, 'value', data_format_arg)
+        derive_right_kwargs = {}
+        if data_format_arg:
+            derive_right_kwargs['data_format'] = data_format_arg
+
+        # Create the Right and test it was persisted
+        right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                          **derive_right_kwargs)
+        assert right.persist_id == mock_right_create_id
+
+        # Test the correct data format was persisted
+        right_persisted_data = _SERIALIZE[data_format](right)
+
+        # Check we called plugin.save() with the right format
+        mock_plugin_for_deriving_rights.save.assert_called_once_with(
+            right_persisted_data, user=alice_user)
+
+    def test_derive_right_with_source_in_data(
+            self, mock_plugin_for_deriving_rights, mock_coalaip,
+            right_data_factory, alice_user, copyright_entity):
+        ignored_copyright_entity = copyright_entity
+        provided_copyright_id = 'provided_copyright_id'
+
+        # Create the default right model, but change the 'source' key to
+        # differentiate it from copyright_entity
+        right_data = right_data_factory(data={
+            'source': provided_copyright_id
+        })
+
+        # Create the Right and test it was persisted with the correct Copyright
+        right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                          source_right=ignored_copyright_entity)
+        assert right.data['source'] == provided_copyright_id
+
+    def test_derive_right_with_existing_source_right(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, right_data,
+            alice_user, persisted_jsonld_registration):
+        persisted_copyright = persisted_jsonld_registration.copyright
+
+        # Remove the 'source' key to use the source_right
+        del right_data['source']
+
+        # Test the new Right is created with the given source_right
+        right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                          source_right=persisted_copyright)
+        assert right.data['source'] == persisted_copyright.persist_id
+
+        # Check we called plugin.save() with the correct Copyright
         right_persisted_data = right.to_jsonld()
-
-    # Check we called plugin.save() with the right format
-    mock_plugin_for_deriving_rights.save.assert_called_once_with(
-        right_persisted_data, user=alice_user)
-
-
-def test_derive_right_with_source_in_data(mock_plugin_for_deriving_rights,
-                                          mock_coalaip, right_data_factory,
-                                          alice_user, copyright_entity):
-    ignored_copyright_entity = copyright_entity
-    provided_copyright_id = 'provided_copyright_id'
-
-    # Create the default right model, but change the 'source' key to
-    # differentiate it from copyright_entity
-    right_data = right_data_factory(data={
-        'source': provided_copyright_id
-    })
-
-    # Create the Right and test it was persisted with the correct Copyright
-    right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                      source_right=ignored_copyright_entity)
-    assert right.data['source'] == provided_copyright_id
-
-
-def test_derive_right_with_existing_source_right(
-        mock_plugin_for_deriving_rights, mock_coalaip, right_data, alice_user,
-        persisted_jsonld_registration):
-    persisted_copyright = persisted_jsonld_registration.copyright
-
-    # Remove the 'source' key to use the source_right
-    del right_data['source']
-
-    # Test the new Right is created with the given source_right
-    right = mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                      source_right=persisted_copyright)
-    assert right.data['source'] == persisted_copyright.persist_id
-
-    # Check we called plugin.save() with the correct Copyright
-    mock_plugin_for_deriving_rights.save.assert_called_once_with(
-        right.to_jsonld(), user=alice_user)
-
-
-def test_derive_right_with_custom_entity_cls(mock_plugin_for_deriving_rights,
-                                             mock_coalaip, right_data,
-                                             alice_user, mock_right_create_id):
-    from coalaip.entities import Right
-    from coalaip.models import _model_factory
-    mock_plugin_for_deriving_rights.save.return_value = mock_right_create_id
-
-    custom_right_type = 'CustomRight'
-
-    class CustomRight(Right):
-        @classmethod
-        def generate_model(cls, *args, **kwargs):
-            return _model_factory(ld_type=custom_right_type, *args, **kwargs)
-
-    # Test the new Right is created with the given source_right
-    custom_right = mock_coalaip.derive_right(
-        right_data,
-        current_holder=alice_user,
-        right_entity_cls=CustomRight
-    )
-    assert isinstance(custom_right, CustomRight)
-    assert custom_right.to_json()['type'] == custom_right_type
-    assert custom_right.persist_id == mock_right_create_id
-    assert custom_right.data['source'] == right_data['source']
-
-
-def test_derive_right_with_existing_source_right_raises_on_non_right(
-        mock_plugin_for_deriving_rights, mock_coalaip, alice_user, right_data):
-    # Remove the 'source' key to use the source_right
-    del right_data['source']
-    with raises(TypeError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                  source_right={})
-
-
-def test_derive_right_with_existing_source_right_raises_on_not_persisted_right(
-        mock_plugin_for_deriving_rights, mock_coalaip, alice_user, right_data,
-        copyright_entity):
-    from coalaip.exceptions import EntityNotYetPersistedError
-
-    # Remove the 'source' key to use the source_right
-    del right_data['source']
-    with raises(EntityNotYetPersistedError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                  source_right=copyright_entity)
-
-
-def test_derive_right_with_existing_source_right_raises_on_incompatible_plugin(
-        mock_plugin_for_deriving_rights, mock_coalaip, alice_user,
-        copyright_data, right_data, mock_copyright_create_id):
-    from coalaip.entities import Copyright
-    from coalaip.exceptions import IncompatiblePluginError
-    from tests.utils import create_mock_plugin
-    diff_plugin = create_mock_plugin()
-    source_right_from_diff_plugin = Copyright.from_data(copyright_data,
-                                                        plugin=diff_plugin)
-
-    # Save the source_right
-    mock_plugin_for_deriving_rights.save.return_value = mock_copyright_create_id
-    source_right_from_diff_plugin.create(user=alice_user)
-
-    # Remove the 'source' key to use the existing_work
-    del right_data['source']
-
-    with raises(IncompatiblePluginError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user,
-                                  source_right=source_right_from_diff_plugin)
-
-
-def test_derive_right_raises_on_no_source_or_source_right(
-        mock_plugin_for_deriving_rights, mock_coalaip, right_data, alice_user):
-    del right_data['source']
-    with raises(ValueError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user)
-
-
-def test_derive_right_raises_on_wrong_entity_given_for_source(
-        mock_plugin_for_deriving_rights, mock_coalaip, mock_load_data_error,
-        right_data, alice_user):
-    from coalaip.exceptions import ModelDataError
-    mock_plugin_for_deriving_rights.load.side_effect = mock_load_data_error
-    with raises(ModelDataError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user)
-
-
-def test_derive_right_raises_on_wrong_rights_holder(
-        mock_plugin_for_deriving_rights, mock_coalaip, right_data, alice_user):
-    from coalaip.exceptions import ModelDataError
-    mock_plugin_for_deriving_rights.is_same_user.return_value = False
-    with raises(ModelDataError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user)
-
-
-def test_derive_right_raises_on_creation_error(mock_plugin_for_deriving_rights,
-                                               mock_coalaip, right_data,
-                                               alice_user):
-    from coalaip.exceptions import EntityCreationError
-
-    mock_creation_error = 'mock_creation_error'
-    mock_plugin_for_deriving_rights.save.side_effect = EntityCreationError(
-        mock_creation_error)
-
-    with raises(EntityCreationError):
-        mock_coalaip.derive_right(right_data, current_holder=alice_user)
-
-
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', [None, 'json', 'jsonld', mark.skip('ipld')])
+        mock_plugin_for_deriving_rights.save.assert_called_once_with(
+            right_persisted_data, user=alice_user)
+
+    def test_derive_right_with_custom_entity_cls(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, right_data,
+            alice_user, mock_right_create_id):
+        from coalaip.entities import Right
+        from coalaip.models import _model_factory
+        mock_plugin_for_deriving_rights.save.return_value = mock_right_create_id
+
+        custom_right_type = 'CustomRight'
+
+        class CustomRight(Right):
+            @classmethod
+            def generate_model(cls, *args, **kwargs):
+                return _model_factory(ld_type=custom_right_type, *args, **kwargs)
+
+        # Test the new Right is created with the given source_right
+        custom_right = mock_coalaip.derive_right(
+            right_data,
+            current_holder=alice_user,
+            right_entity_cls=CustomRight
+        )
+        assert isinstance(custom_right, CustomRight)
+        assert custom_right.to_json()['type'] == custom_right_type
+        assert custom_right.persist_id == mock_right_create_id
+        assert custom_right.data['source'] == right_data['source']
+
+    def test_derive_right_with_existing_source_right_raises_on_non_right(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, alice_user,
+            right_data):
+        # Remove the 'source' key to use the source_right
+        del right_data['source']
+        with raises(TypeError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                      source_right={})
+
+    def test_derive_right_with_existing_source_right_raises_on_not_persisted_right(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, alice_user,
+            right_data, copyright_entity):
+        from coalaip.exceptions import EntityNotYetPersistedError
+
+        # Remove the 'source' key to use the source_right
+        del right_data['source']
+        with raises(EntityNotYetPersistedError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                      source_right=copyright_entity)
+
+    def test_derive_right_with_existing_source_right_raises_on_incompatible_plugin(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, alice_user,
+            copyright_data, right_data, mock_copyright_create_id):
+        from coalaip.entities import Copyright
+        from coalaip.exceptions import IncompatiblePluginError
+        from tests.utils import create_mock_plugin
+        diff_plugin = create_mock_plugin()
+        source_right_from_diff_plugin = Copyright.from_data(copyright_data,
+                                                            plugin=diff_plugin)
+
+        # Save the source_right
+        mock_plugin_for_deriving_rights.save.return_value = mock_copyright_create_id
+        source_right_from_diff_plugin.create(user=alice_user)
+
+        # Remove the 'source' key to use the existing_work
+        del right_data['source']
+
+        with raises(IncompatiblePluginError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user,
+                                      source_right=source_right_from_diff_plugin)
+
+    def test_derive_right_raises_on_no_source_or_source_right(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, right_data,
+            alice_user):
+        del right_data['source']
+        with raises(ValueError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user)
+
+    def test_derive_right_raises_on_wrong_entity_given_for_source(
+            self, mock_plugin_for_deriving_rights, mock_coalaip,
+            mock_load_data_error, right_data, alice_user):
+        from coalaip.exceptions import ModelDataError
+        mock_plugin_for_deriving_rights.load.side_effect = mock_load_data_error
+        with raises(ModelDataError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user)
+
+    def test_derive_right_raises_on_wrong_rights_holder(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, right_data,
+            alice_user):
+        from coalaip.exceptions import ModelDataError
+        mock_plugin_for_deriving_rights.is_same_user.return_value = False
+        with raises(ModelDataError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user)
+
+    def test_derive_right_raises_on_creation_error(
+            self, mock_plugin_for_deriving_rights, mock_coalaip, right_data,
+            alice_user):
+        from coalaip.exceptions import EntityCreationError
+
+        mock_creation_error = 'mock_creation_error'
+        mock_plugin_for_deriving_rights.save.side_effect = EntityCreationError(
+            mock_creation_error)
+
+        with raises(EntityCreationError):
+            mock_coalaip.derive_right(right_data, current_holder=alice_user)
+
+
+@mark.parametrize('data_format_arg', DATA_FORMAT_ARGS)
 def test_transfer_right(mock_plugin, mock_coalaip, alice_user, bob_user,
-                        data_format, use_data_format_enum,
-                        rights_assignment_data, persisted_jsonld_derived_right,
+                        data_format_arg, rights_assignment_data,
+                        persisted_jsonld_derived_right,
                         mock_rights_assignment_transfer_id):
+    data_format = getattr(data_format_arg, 'value', data_format_arg)
     mock_plugin.transfer.return_value = mock_rights_assignment_transfer_id
 
     transfer_right_kwargs = {}
-    if data_format:
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format_arg = get_data_format_enum_member(data_format)
-        else:
-            data_format_arg = data_format
+    if data_format_arg:
         transfer_right_kwargs['rights_assignment_format'] = data_format_arg
 
     # Transfer the Right and test the resulting RightsAssignment is correct
@@ -553,12 +504,7 @@ def test_transfer_right(mock_plugin, mock_coalaip, alice_user, bob_user,
     assert rights_assignment.data == rights_assignment_data
 
     # Test the correct data format was used in the transfer
-    if data_format == 'json':
-        rights_assignment_persisted_data = rights_assignment.to_json()
-    elif data_format == 'ipld':
-        raise NotImplementedError('IPLD is not implemented yet')
-    else:
-        rights_assignment_persisted_data = rights_assignment.to_jsonld()
+    rights_assignment_persisted_data = _SERIALIZE[data_format](rights_assignment)
 
     # Check we called plugin.transfer() with the right format
     mock_plugin.transfer.assert_called_once_with(
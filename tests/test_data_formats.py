@@ -1,24 +1,37 @@
-from pytest import mark, raises
+from collections.abc import Mapping
 from types import MappingProxyType
 
-
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format,format_resolved', [
-    ('json', 'json_resolved'),
-    ('jsonld', 'jsonld_resolved'),
-    ('ipld', 'ipld_resolved')
-])
-def test_data_format_resolver(data_format, format_resolved,
-                              use_data_format_enum):
-    from coalaip.data_formats import DataFormat, _data_format_resolver
-    if use_data_format_enum:
-        data_format = DataFormat(data_format)
-
-    resolver = {}
-    resolver[data_format] = format_resolved
-
-    resolved = _data_format_resolver(data_format, resolver)
-    assert resolved == format_resolved
+from pytest import fixture, mark, raises
+
+from coalaip import data_formats
+from coalaip.data_formats import (
+    DataFormat,
+    _copy_context_into_mutable,
+    _data_format_resolver,
+    _extract_ld_data,
+    _extract_ld_data_from_keys,
+    _get_format_from_data,
+    _make_context_immutable,
+)
+
+
+def test_data_format_resolver():
+    str_keyed_resolver = {
+        'json': 'json_resolved',
+        'jsonld': 'jsonld_resolved',
+        'ipld': 'ipld_resolved',
+    }
+    for data_format, format_resolved in str_keyed_resolver.items():
+        # Both the string and enum formats resolve through string keys
+        assert _data_format_resolver(
+            data_format, str_keyed_resolver) == format_resolved
+        assert _data_format_resolver(
+            DataFormat(data_format), str_keyed_resolver) == format_resolved
+
+        # Enum keys are also resolvable
+        enum_keyed_resolver = {DataFormat(data_format): format_resolved}
+        assert _data_format_resolver(
+            data_format, enum_keyed_resolver) == format_resolved
 
 
 @mark.parametrize('immutable_ld_context', [
@@ -29,8 +42,6 @@ def test_data_format_resolver(data_format, format_resolved,
     (MappingProxyType({'mixed': 'array'}), 'for', 'context'),
 ])
 def test_copy_context_into_mutable(immutable_ld_context):
-    from collections import Mapping
-    from coalaip.data_formats import _copy_context_into_mutable
     mutable_context = _copy_context_into_mutable(immutable_ld_context)
 
     if not immutable_ld_context:
@@ -53,8 +64,6 @@ def test_copy_context_into_mutable(immutable_ld_context):
     [{'mixed': 'array'}, 'for', 'context'],
 ])
 def test_make_context_immutable(mutable_ld_context):
-    from collections import Mapping
-    from coalaip.data_formats import _make_context_immutable
     immutable_context = _make_context_immutable(mutable_ld_context)
 
     if not mutable_ld_context:
@@ -71,16 +80,14 @@ def test_make_context_immutable(mutable_ld_context):
 
 
 def test_data_format_resolver_raises_on_bad_format():
-    from coalaip.data_formats import _data_format_resolver
     with raises(ValueError):
         _data_format_resolver('bad_format', {})
 
 
 @mark.parametrize('data_format', ['json', 'jsonld', 'ipld'])
 def test_extract_ld_data_calls_extract_format(mocker, data_format):
-    from coalaip.data_formats import _extract_ld_data
-    mock_extract_from_format = mocker.patch(
-        'coalaip.data_formats._extract_ld_data_from_{}'.format(data_format))
+    mock_extract_from_format = mocker.patch.object(
+        data_formats, '_extract_ld_data_from_{}'.format(data_format))
     data = {'data': 'data'}
     kwargs = {'type_key': 'type', 'context_key': 'context', 'id_key': 'id'}
 
@@ -89,9 +96,8 @@ def test_extract_ld_data_calls_extract_format(mocker, data_format):
 
 
 def test_extract_ld_data_finds_type_from_data(mocker):
-    from coalaip.data_formats import _extract_ld_data
-    mock_get_format = mocker.patch('coalaip.data_formats._get_format_from_data')
-    mock_extract_from_json = mocker.patch('coalaip.data_formats._extract_ld_data_from_json')
+    mock_get_format = mocker.patch.object(data_formats, '_get_format_from_data')
+    mock_extract_from_json = mocker.patch.object(data_formats, '_extract_ld_data_from_json')
 
     mock_get_format.return_value = 'json'
     data = {'data': 'data'}
@@ -101,18 +107,28 @@ def test_extract_ld_data_finds_type_from_data(mocker):
     mock_extract_from_json.assert_called_once_with(data)
 
 
+# Resolved once at import instead of a getattr per parametrize row;
+# the ipld rows never reach the lookup since they're skipped
+LD_DATA_EXTRACTORS = {
+    'json': data_formats._extract_ld_data_from_json,
+    'jsonld': data_formats._extract_ld_data_from_jsonld,
+}
+
+
+@fixture
+def mock_extract_from_keys(mocker):
+    return mocker.patch.object(data_formats, '_extract_ld_data_from_keys')
+
+
 @mark.parametrize('data_format,default_keys', [
     ('json', {'type_key': 'type'}),
     ('jsonld', {'type_key': '@type', 'context_key': '@context', 'id_key': '@id'}),
     mark.skip(('ipld', {'type_key': 'type'})),
 ])
-def test_extract_from_format_calls_extract_from_keys(mocker, data_format,
+def test_extract_from_format_calls_extract_from_keys(mock_extract_from_keys,
+                                                     data_format,
                                                      default_keys):
-    import importlib
-    utils = importlib.import_module('coalaip.data_formats')
-    extract_fn = getattr(utils, '_extract_ld_data_from_{}'.format(data_format))
-
-    mock_extract_from_keys = mocker.patch('coalaip.data_formats._extract_ld_data_from_keys')
+    extract_fn = LD_DATA_EXTRACTORS[data_format]
     data = {'data': 'data'}
 
     extract_fn(data)
@@ -124,13 +140,9 @@ def test_extract_from_format_calls_extract_from_keys(mocker, data_format,
     ('jsonld', {'type_key': 'custom_type', 'context_key': 'custom_context', 'id_key': 'custom_id'}),
     mark.skip(('ipld', {'type_key': 'custom_type'})),
 ])
-def test_extract_from_format_calls_with_non_default_keys(mocker, data_format,
-                                                         custom_keys):
-    import importlib
-    utils = importlib.import_module('coalaip.data_formats')
-    extract_fn = getattr(utils, '_extract_ld_data_from_{}'.format(data_format))
-
-    mock_extract_from_keys = mocker.patch('coalaip.data_formats._extract_ld_data_from_keys')
+def test_extract_from_format_calls_with_non_default_keys(
+        mock_extract_from_keys, data_format, custom_keys):
+    extract_fn = LD_DATA_EXTRACTORS[data_format]
     data = {'data': 'data'}
 
     extract_fn(data, **custom_keys)
@@ -138,7 +150,6 @@ def test_extract_from_format_calls_with_non_default_keys(mocker, data_format,
 
 
 def test_extract_ld_data_from_keys(work_data, work_jsonld):
-    from coalaip.data_formats import _extract_ld_data_from_keys
     result = _extract_ld_data_from_keys(work_jsonld, type_key='@type',
                                         context_key='@context', id_key='@id')
     assert result.data == work_data
@@ -148,7 +159,6 @@ def test_extract_ld_data_from_keys(work_data, work_jsonld):
 
 
 def test_extract_ld_data_from_keys_ignores_missing_keys(work_data):
-    from coalaip.data_formats import _extract_ld_data_from_keys
     result = _extract_ld_data_from_keys(work_data, type_key='@type',
                                         context_key='@context', id_key='@id')
     assert result.data == work_data
@@ -157,15 +167,19 @@ def test_extract_ld_data_from_keys_ignores_missing_keys(work_data):
     assert result.ld_id is None
 
 
-@mark.parametrize('data,expected_format', [
+# Built once at import so collection doesn't re-allocate the case table
+GET_FORMAT_FROM_DATA_CASES = [
     ({'@type': 'type'}, 'jsonld'),
     ({'@context': 'context'}, 'jsonld'),
     ({'@id': 'id'}, 'jsonld'),
     ({'type': 'type'}, 'json'),
     ({'data': 'data'}, 'json'),
-])
+]
+
+
+@mark.parametrize('data,expected_format', GET_FORMAT_FROM_DATA_CASES,
+                  ids=['@type', '@context', '@id', 'type', 'no-ld-keys'])
 def test_get_format_from_data(data, expected_format):
-    from coalaip.data_formats import DataFormat, _get_format_from_data
 
     result_format = _get_format_from_data(data)
     assert result_format is DataFormat(expected_format)
@@ -1,70 +1,140 @@
 #!/usr/bin/env python
 
-from pytest import mark, raises
-
-
-ALL_ENTITIES = [
-    'work_entity',
-    'manifestation_entity',
-    'right_entity',
-    'copyright_entity',
-    'rights_assignment_entity',
-]
-
-CREATABLE_ENTITIES = [e for e in ALL_ENTITIES
-                      if e != 'rights_assignment_entity']
-
-CLS_FOR_ENTITY = {
-    'work_entity': 'Work',
-    'manifestation_entity': 'Manifestation',
-    'right_entity': 'Right',
-    'copyright_entity': 'Copyright',
-    'rights_assignment_entity': 'RightsAssignment',
-}
-
-ALL_ENTITY_CLS = [
+from types import SimpleNamespace
+
+from pytest import fixture, mark, param, raises
+
+from coalaip import entities
+from coalaip.entities import Copyright, Manifestation, Right, Work
+from coalaip.exceptions import (
+    EntityCreationError,
+    EntityNotFoundError,
+    EntityNotYetPersistedError,
+    EntityPreviouslyCreatedError,
+    EntityTransferError,
+    ModelDataError,
+    ModelError,
+    ModelNotYetLoadedError,
+    PersistenceError,
+)
+from coalaip.models import LazyLoadableModel, Model
+from tests.utils import (
+    assert_key_values_present_in_dict,
+    extend_dict,
+    get_data_format_enum_member,
+)
+
+
+ALL_ENTITY_CLS = (
     'Work',
     'Manifestation',
     'Right',
     'Copyright',
     'RightsAssignment',
-]
-
-DATA_NAME_FOR_ENTITY_CLS = {
-    'Work': 'work_data',
-    'Manifestation': 'manifestation_data',
-    'Copyright': 'copyright_data',
-    'Right': 'right_data',
-    'RightsAssignment': 'rights_assignment_data',
+)
+
+# Single lookup table holding each entity class alongside the names of
+# its entity and data fixtures
+ENTITY_INFO = {
+    entity_cls_name: SimpleNamespace(
+        cls=getattr(entities, entity_cls_name),
+        entity='{}_entity'.format(fixture_prefix),
+        data='{}_data'.format(fixture_prefix),
+        json='{}_json'.format(fixture_prefix),
+        jsonld='{}_jsonld'.format(fixture_prefix),
+    )
+    for entity_cls_name, fixture_prefix in [
+        ('Work', 'work'),
+        ('Manifestation', 'manifestation'),
+        ('Right', 'right'),
+        ('Copyright', 'copyright'),
+        ('RightsAssignment', 'rights_assignment'),
+    ]
 }
 
-JSON_NAME_FOR_ENTITY_CLS = {
-    'Work': 'work_json',
-    'Manifestation': 'manifestation_json',
-    'Copyright': 'copyright_json',
-    'Right': 'right_json',
-    'RightsAssignment': 'rights_assignment_json',
-}
+CLS_FOR_ENTITY = {info.entity: entity_cls_name
+                  for entity_cls_name, info in ENTITY_INFO.items()}
 
-JSONLD_NAME_FOR_ENTITY_CLS = {
-    'Work': 'work_jsonld',
-    'Manifestation': 'manifestation_jsonld',
-    'Copyright': 'copyright_jsonld',
-    'Right': 'right_jsonld',
-    'RightsAssignment': 'rights_assignment_jsonld',
-}
+# The entity-fixture parametrize axes are derived from the same table so
+# the two keying schemes (class names and entity fixture names) can't
+# drift apart
+ALL_ENTITIES = tuple(info.entity for info in ENTITY_INFO.values())
+
+CREATABLE_ENTITIES = tuple(e for e in ALL_ENTITIES
+                           if e != 'rights_assignment_entity')
+
+CREATABLE_ENTITY_IDS = tuple(CLS_FOR_ENTITY[e] for e in CREATABLE_ENTITIES)
 
 
 def get_entity_cls(entity_cls_name):
-    import importlib
-    entities = importlib.import_module('coalaip.entities')
-    entity_cls = getattr(entities, entity_cls_name)
-    return entity_cls
+    return ENTITY_INFO[entity_cls_name].cls
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_init(mock_plugin, base_model, entity_cls_name):
-    entity_cls = get_entity_cls(entity_cls_name)
+# Tests that don't need an entity's fixtures parametrize over the
+# classes themselves (with the names as ids) to skip the name-to-class
+# lookup
+ENTITY_CLASSES = tuple(info.cls for info in ENTITY_INFO.values())
+
+
+class NonSubclassPlugin():
+    pass
+
+
+NON_SUBCLASSED_PLUGIN = NonSubclassPlugin()
+
+
+@fixture
+def entity_bundle(request):
+    # Bundles an entity class together with its data, json, and jsonld
+    # fixtures so tests parametrized indirectly on the class name get
+    # everything through a single fixture lookup
+    entity_cls_name = request.param
+    return (
+        get_entity_cls(entity_cls_name),
+        request.getfixturevalue(ENTITY_INFO[entity_cls_name].data),
+        request.getfixturevalue(ENTITY_INFO[entity_cls_name].json),
+        request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld),
+    )
+
+
+@fixture
+def entity(request):
+    # Resolves an entity fixture by name, so tests can parametrize over
+    # the fixture-name lists indirectly instead of dispatching through
+    # request.getfixturevalue in their bodies
+    return request.getfixturevalue(request.param)
+
+
+PERSISTED_RIGHT_PARAMS = (
+    ('right_entity', 'mock_right_create_id'),
+    ('copyright_entity', 'mock_copyright_create_id'),
+)
+
+
+@fixture
+def persisted_right(request, mock_plugin, alice_user):
+    # A Right (or Copyright) already created on the mock plugin,
+    # together with the persist id it was created under, for the
+    # transfer tests that need an already-persisted right
+    right_name, create_id_name = request.param
+    right_entity = request.getfixturevalue(right_name)
+    create_id = request.getfixturevalue(create_id_name)
+    mock_plugin.save.return_value = create_id
+    right_entity.create(user=alice_user)
+    return right_entity, create_id
+
+
+@fixture
+def persisted_entity(request, mock_entity_create_id):
+    # An entity with its persist_id already set, for the tests that
+    # exercise behaviour of already-persisted entities
+    entity = request.getfixturevalue(request.param)
+    entity.persist_id = mock_entity_create_id
+    return entity
+
+
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_init(mock_plugin, base_model, entity_cls):
     entity = entity_cls(base_model, plugin=mock_plugin)
     assert entity.model == base_model
     assert entity.data == base_model.data
@@ -72,44 +142,44 @@ def test_entity_init(mock_plugin, base_model, entity_cls_name):
     assert entity.persist_id is None
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-@mark.parametrize('bad_model', [1, ('name', 'id'), {'name': 'name'}])
-def test_entity_init_raises_on_non_model(mock_plugin, bad_model,
-                                         entity_cls_name):
-    entity_cls = get_entity_cls(entity_cls_name)
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+@mark.parametrize('bad_model', [
+    1,
+    ('name', 'id'),
+    # Kept hashable (and rebuilt into a dict below) so pytest can key
+    # its parametrization caches by value
+    frozenset({'name': 'name'}.items()),
+], ids=['int', 'tuple', 'dict'])
+def test_entity_init_raises_on_non_model(mock_plugin, bad_model, entity_cls):
+    if isinstance(bad_model, frozenset):
+        bad_model = dict(bad_model)
     with raises(TypeError):
         entity_cls(model=bad_model, plugin=mock_plugin)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_init_raises_on_no_plugin(base_model, entity_cls_name):
-    entity_cls = get_entity_cls(entity_cls_name)
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_init_raises_on_no_plugin(base_model, entity_cls):
     with raises(TypeError):
         entity_cls(model=base_model, plugin=None)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_init_raises_on_non_subclassed_plugin(base_model,
-                                                     entity_cls_name):
-    entity_cls = get_entity_cls(entity_cls_name)
-
-    class NonSubclassPlugin():
-        pass
-
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_init_raises_on_non_subclassed_plugin(base_model, entity_cls):
     # Instantiation should raise if plugin not subclassed from AbstractPlugin
     with raises(TypeError):
-        entity_cls(model=base_model, plugin=NonSubclassPlugin())
+        entity_cls(model=base_model, plugin=NON_SUBCLASSED_PLUGIN)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', [None, 'json', 'jsonld', mark.skip('ipld')])
-def test_entity_init_from_data(mock_plugin, data_format, use_data_format_enum,
-                               entity_cls_name, request):
-    entity_cls = get_entity_cls(entity_cls_name)
-    data = request.getfixturevalue(DATA_NAME_FOR_ENTITY_CLS[entity_cls_name])
-    json = request.getfixturevalue(JSON_NAME_FOR_ENTITY_CLS[entity_cls_name])
-    jsonld = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
+@mark.parametrize('entity_bundle', ALL_ENTITY_CLS, indirect=True,
+                  ids=ALL_ENTITY_CLS)
+@mark.parametrize('data_format', [
+    None,
+    'json',
+    'jsonld',
+    param('ipld', marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['default', 'json', 'jsonld', 'ipld'])
+def test_entity_init_from_data(mock_plugin, data_format, entity_bundle):
+    entity_cls, data, json, jsonld = entity_bundle
 
     kwargs = {}
     if data_format is None:
@@ -120,9 +190,6 @@ def test_entity_init_from_data(mock_plugin, data_format, use_data_format_enum,
         elif data_format == 'jsonld':
             kwargs['data'] = jsonld
 
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format = get_data_format_enum_member(data_format)
         kwargs['data_format'] = data_format
 
     entity = entity_cls.from_data(plugin=mock_plugin, **kwargs)
@@ -131,24 +198,41 @@ def test_entity_init_from_data(mock_plugin, data_format, use_data_format_enum,
     assert entity.to_jsonld() == jsonld
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
+@mark.parametrize('data_format', ['json', 'jsonld'], ids=['json', 'jsonld'])
+def test_data_format_enum_equivalence(mock_plugin, data_format, work_json,
+                                      work_jsonld):
+    # The DataFormat members and their string values are interchangeable
+    # everywhere a data format is accepted, so the other tests only
+    # exercise the strings
+    data = work_json if data_format == 'json' else work_jsonld
+
+    from_str = Work.from_data(dict(data), data_format=data_format,
+                              plugin=mock_plugin)
+    from_enum = Work.from_data(
+        dict(data), data_format=get_data_format_enum_member(data_format),
+        plugin=mock_plugin)
+    assert from_str.to_json() == from_enum.to_json()
+    assert from_str.to_jsonld() == from_enum.to_jsonld()
+
+
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
 def test_entity_from_data_consistent(mock_plugin, entity_cls_name, request):
-    from tests.utils import assert_key_values_present_in_dict
     entity_cls = get_entity_cls(entity_cls_name)
-    entity_data = request.getfixturevalue(DATA_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    entity_data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].data)
 
     entity = entity_cls.from_data(data=entity_data, plugin=mock_plugin)
+    entity_json = entity.to_json()
+    entity_jsonld = entity.to_jsonld()
 
-    assert_key_values_present_in_dict(entity.to_json(), **entity_data)
-    assert_key_values_present_in_dict(entity.to_jsonld(), **entity_data)
+    assert_key_values_present_in_dict(entity_json, **entity_data)
+    assert_key_values_present_in_dict(entity_jsonld, **entity_data)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
 def test_entity_from_jsonld_data_keeps_ld_id(mock_plugin, entity_cls_name,
                                              mock_entity_create_id, request):
-    from tests.utils import assert_key_values_present_in_dict
     entity_cls = get_entity_cls(entity_cls_name)
-    jsonld = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    jsonld = request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld)
 
     jsonld['@id'] = mock_entity_create_id
     entity = entity_cls.from_data(data=jsonld, data_format='jsonld',
@@ -157,13 +241,10 @@ def test_entity_from_jsonld_data_keeps_ld_id(mock_plugin, entity_cls_name,
     assert_key_values_present_in_dict(entity.to_jsonld(), **jsonld)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_data_and_to_format_are_copies(mock_plugin, entity_cls_name,
-                                              request):
-    entity_cls = get_entity_cls(entity_cls_name)
-    entity_data = request.getfixturevalue(DATA_NAME_FOR_ENTITY_CLS[entity_cls_name])
-
-    entity = entity_cls.from_data(data=entity_data, plugin=mock_plugin)
+def test_entity_data_and_to_format_are_copies(mock_plugin, work_data):
+    # The copy-on-access behaviour lives on the base Entity, so checking
+    # it once through Work covers every subclass
+    entity = Work.from_data(data=work_data, plugin=mock_plugin)
     data = entity.data
     json = entity.to_json()
     jsonld = entity.to_jsonld()
@@ -182,56 +263,48 @@ def test_entity_data_and_to_format_are_copies(mock_plugin, entity_cls_name,
     assert 'new_data' not in entity.to_jsonld()
 
 
-@mark.parametrize('entity_cls_name', ['Work', 'Copyright', 'RightsAssignment'])
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', ['json', 'jsonld', mark.skip('ipld')])
+def _diff_type_from_data_kwargs(request, entity_cls_name, data_format,
+                                override_type):
+    # Shared setup for the diff-type tests: fetch the entity's data in
+    # the requested format and override its type key
+    if data_format == 'json':
+        data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].json)
+        data['type'] = override_type
+    else:
+        data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld)
+        data['@type'] = override_type
+    return {'data': data, 'data_format': data_format}
+
+
+@mark.parametrize('entity_cls_name', ['Work', 'Copyright', 'RightsAssignment'],
+                  ids=['Work', 'Copyright', 'RightsAssignment'])
+@mark.parametrize('data_format', [
+    'json',
+    'jsonld',
+    param('ipld', marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['json', 'jsonld', 'ipld'])
 def test_strict_type_entity_raises_on_diff_type_from_data(
-        mock_plugin, data_format, use_data_format_enum, entity_cls_name,
-        mock_entity_type, request):
-    from coalaip.exceptions import ModelError
+        mock_plugin, data_format, entity_cls_name, mock_entity_type, request):
     entity_cls = get_entity_cls(entity_cls_name)
-
-    kwargs = {}
-    if data_format:
-        if data_format == 'json':
-            data = request.getfixturevalue(JSON_NAME_FOR_ENTITY_CLS[entity_cls_name])
-            data['type'] = mock_entity_type
-        elif data_format == 'jsonld':
-            data = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
-            data['@type'] = mock_entity_type
-
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format = get_data_format_enum_member(data_format)
-        kwargs['data_format'] = data_format
-    kwargs['data'] = data
+    kwargs = _diff_type_from_data_kwargs(request, entity_cls_name, data_format,
+                                         mock_entity_type)
 
     with raises(ModelError):
         entity_cls.from_data(plugin=mock_plugin, **kwargs)
 
 
-@mark.parametrize('entity_cls_name', ['Manifestation', 'Right'])
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', ['json', 'jsonld', mark.skip('ipld')])
+@mark.parametrize('entity_cls_name', ['Manifestation', 'Right'],
+                  ids=['Manifestation', 'Right'])
+@mark.parametrize('data_format', [
+    'json',
+    'jsonld',
+    param('ipld', marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['json', 'jsonld', 'ipld'])
 def test_non_strict_type_entity_keeps_diff_type_from_data(
-        mock_plugin, data_format, use_data_format_enum, entity_cls_name,
-        mock_entity_type, request):
+        mock_plugin, data_format, entity_cls_name, mock_entity_type, request):
     entity_cls = get_entity_cls(entity_cls_name)
-
-    kwargs = {}
-    if data_format:
-        if data_format == 'json':
-            data = request.getfixturevalue(JSON_NAME_FOR_ENTITY_CLS[entity_cls_name])
-            data['type'] = mock_entity_type
-        elif data_format == 'jsonld':
-            data = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
-            data['@type'] = mock_entity_type
-
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format = get_data_format_enum_member(data_format)
-        kwargs['data_format'] = data_format
-    kwargs['data'] = data
+    kwargs = _diff_type_from_data_kwargs(request, entity_cls_name, data_format,
+                                         mock_entity_type)
 
     entity = entity_cls.from_data(plugin=mock_plugin, **kwargs)
 
@@ -240,22 +313,15 @@ def test_non_strict_type_entity_keeps_diff_type_from_data(
     assert entity.to_jsonld()['@type'] == mock_entity_type
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-@mark.parametrize('use_data_format_enum', [True, False])
-def test_entity_keeps_context_from_ld_data(mock_plugin, use_data_format_enum,
-                                           entity_cls_name,
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
+def test_entity_keeps_context_from_ld_data(mock_plugin, entity_cls_name,
                                            mock_entity_context, request):
     entity_cls = get_entity_cls(entity_cls_name)
 
-    data = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld)
     data['@context'] = mock_entity_context
 
-    data_format = 'jsonld'
-    if use_data_format_enum:
-        from tests.utils import get_data_format_enum_member
-        data_format = get_data_format_enum_member(data_format)
-
-    entity = entity_cls.from_data(data, data_format=data_format,
+    entity = entity_cls.from_data(data, data_format='jsonld',
                                   plugin=mock_plugin)
 
     # Test entity keeps @context if the data's in JSON-LD
@@ -263,26 +329,25 @@ def test_entity_keeps_context_from_ld_data(mock_plugin, use_data_format_enum,
     assert entity.to_jsonld()['@context'] == mock_entity_context
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', ['json', mark.skip('ipld')])
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
+@mark.parametrize('data_format', [
+    'json',
+    param('ipld', marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['json', 'ipld'])
 def test_entity_ignores_context_from_non_ld_data(
-        mock_plugin, data_format, use_data_format_enum, entity_cls_name,
-        mock_entity_context, request):
+        mock_plugin, data_format, entity_cls_name, mock_entity_context,
+        request):
     entity_cls = get_entity_cls(entity_cls_name)
 
-    data = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld)
     data['@context'] = mock_entity_context
 
     kwargs = {}
     if data_format:
         if data_format == 'json':
-            data = request.getfixturevalue(JSON_NAME_FOR_ENTITY_CLS[entity_cls_name])
+            data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].json)
             data['context'] = mock_entity_context
 
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format = get_data_format_enum_member(data_format)
         kwargs['data_format'] = data_format
     kwargs['data'] = data
 
@@ -293,13 +358,11 @@ def test_entity_ignores_context_from_non_ld_data(
     assert entity.to_jsonld()['@context'] != mock_entity_context
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
 def test_entity_init_from_persist_id(mock_plugin, entity_cls_name,
                                      mock_entity_create_id, request):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import ModelNotYetLoadedError
     entity_cls = get_entity_cls(entity_cls_name)
-    entity_data = request.getfixturevalue(DATA_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    entity_data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].data)
     entity_from_data = entity_cls.from_data(entity_data, plugin=mock_plugin)
 
     entity_from_persist_id = entity_cls.from_persist_id(mock_entity_create_id,
@@ -314,14 +377,12 @@ def test_entity_init_from_persist_id(mock_plugin, entity_cls_name,
         entity_from_persist_id.model.data
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
 def test_entity_init_from_persist_id_force_load(mocker, mock_plugin,
-                                                entity_cls_name,
+                                                entity_cls,
                                                 mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
     mocker.patch.object(LazyLoadableModel, 'load')
 
-    entity_cls = get_entity_cls(entity_cls_name)
     entity_from_persist_id = entity_cls.from_persist_id(mock_entity_create_id,
                                                         force_load=True,
                                                         plugin=mock_plugin)
@@ -330,14 +391,11 @@ def test_entity_init_from_persist_id_force_load(mocker, mock_plugin,
                                             plugin=mock_plugin)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_init_from_persist_id_can_load(mocker, mock_plugin,
-                                              entity_cls_name,
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_init_from_persist_id_can_load(mocker, mock_plugin, entity_cls,
                                               mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
     mocker.patch.object(LazyLoadableModel, 'load')
 
-    entity_cls = get_entity_cls(entity_cls_name)
     entity_from_persist_id = entity_cls.from_persist_id(mock_entity_create_id,
                                                         plugin=mock_plugin)
     lazy_model = entity_from_persist_id.model
@@ -346,15 +404,14 @@ def test_entity_init_from_persist_id_can_load(mocker, mock_plugin,
                                             plugin=mock_plugin)
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
+@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS, ids=ALL_ENTITY_CLS)
 def test_entity_init_from_persist_id_loads_on_data_access(
         mocker, mock_plugin, entity_cls_name, mock_entity_create_id,
         mock_entity_type, request):
-    from coalaip.models import Model, LazyLoadableModel
     mocker.patch.object(LazyLoadableModel, 'load')
 
     entity_cls = get_entity_cls(entity_cls_name)
-    entity_data = request.getfixturevalue(DATA_NAME_FOR_ENTITY_CLS[entity_cls_name])
+    entity_data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].data)
     entity_from_persist_id = entity_cls.from_persist_id(mock_entity_create_id,
                                                         plugin=mock_plugin)
 
@@ -371,11 +428,15 @@ def test_entity_init_from_persist_id_loads_on_data_access(
     assert entity_from_persist_id.model.data == entity_data
 
 
-@mark.parametrize('entity_name', CREATABLE_ENTITIES)
-@mark.parametrize('use_data_format_enum', [True, False])
-@mark.parametrize('data_format', [None, 'json', 'jsonld', mark.skip('ipld')])
-def test_entity_create(mock_plugin, alice_user, data_format,
-                       use_data_format_enum, entity_name,
+@mark.parametrize('entity_name', CREATABLE_ENTITIES,
+                  ids=CREATABLE_ENTITY_IDS)
+@mark.parametrize('data_format', [
+    None,
+    'json',
+    'jsonld',
+    param('ipld', marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['default', 'json', 'jsonld', 'ipld'])
+def test_entity_create(mock_plugin, alice_user, data_format, entity_name,
                        mock_entity_create_id, request):
     entity = request.getfixturevalue(entity_name)
     entity_cls_name = CLS_FOR_ENTITY[entity_name]
@@ -383,52 +444,41 @@ def test_entity_create(mock_plugin, alice_user, data_format,
     mock_plugin.save.return_value = mock_entity_create_id
 
     if data_format:
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format_arg = get_data_format_enum_member(data_format)
-        else:
-            data_format_arg = data_format
-        persist_id = entity.create(alice_user, data_format_arg)
+        persist_id = entity.create(alice_user, data_format)
     else:
         persist_id = entity.create(alice_user)
-    assert mock_plugin.save.call_count == 1
     assert persist_id == mock_entity_create_id
     assert persist_id == entity.persist_id
 
     if not data_format or data_format == 'jsonld':
-        data = request.getfixturevalue(JSONLD_NAME_FOR_ENTITY_CLS[entity_cls_name])
+        data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].jsonld)
     elif data_format == 'json':
-        data = request.getfixturevalue(JSON_NAME_FOR_ENTITY_CLS[entity_cls_name])
-    mock_plugin.save.assert_called_with(data, user=alice_user)
+        data = request.getfixturevalue(ENTITY_INFO[entity_cls_name].json)
+    mock_plugin.save.assert_called_once_with(data, user=alice_user)
 
 
-@mark.parametrize('entity_name', CREATABLE_ENTITIES)
-def test_entity_create_raises_on_bad_format(alice_user, entity_name, request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('entity', CREATABLE_ENTITIES, indirect=True,
+                  ids=CREATABLE_ENTITY_IDS)
+def test_entity_create_raises_on_bad_format(alice_user, entity):
     with raises(ValueError):
         entity.create(alice_user, 'bad_format')
 
 
-@mark.parametrize('entity_name', CREATABLE_ENTITIES)
+@mark.parametrize('entity', CREATABLE_ENTITIES, indirect=True,
+                  ids=CREATABLE_ENTITY_IDS)
 def test_entity_create_raises_on_creation_error(mock_plugin, alice_user,
-                                                entity_name,
-                                                mock_creation_error,
-                                                request):
-    from coalaip.exceptions import EntityCreationError
+                                                mock_creation_error, entity):
     mock_plugin.save.side_effect = mock_creation_error
 
-    entity = request.getfixturevalue(entity_name)
     with raises(EntityCreationError) as excinfo:
         entity.create(alice_user)
     assert mock_creation_error == excinfo.value
 
 
-@mark.parametrize('entity_name', CREATABLE_ENTITIES)
+@mark.parametrize('entity', CREATABLE_ENTITIES, indirect=True,
+                  ids=CREATABLE_ENTITY_IDS)
 def test_entity_create_raises_on_creation_if_already_created(
-        mock_plugin, alice_user, entity_name, mock_entity_create_id, request):
-    from coalaip.exceptions import EntityPreviouslyCreatedError
-    entity = request.getfixturevalue(entity_name)
-
+        mock_plugin, alice_user, mock_entity_create_id, entity):
     # Save the entity
     mock_plugin.save.return_value = mock_entity_create_id
     entity.create(alice_user)
@@ -439,11 +489,8 @@ def test_entity_create_raises_on_creation_if_already_created(
     assert mock_entity_create_id == excinfo.value.existing_id
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_load_raises_if_not_persisted(mock_plugin, entity_cls_name):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import EntityNotYetPersistedError
-    entity_cls = get_entity_cls(entity_cls_name)
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_load_raises_if_not_persisted(mock_plugin, entity_cls):
     model = entity_cls.generate_model(model_cls=LazyLoadableModel)
     entity = entity_cls(model, mock_plugin)
 
@@ -451,13 +498,10 @@ def test_entity_load_raises_if_not_persisted(mock_plugin, entity_cls_name):
         entity.load()
 
 
-@mark.parametrize('entity_cls_name', ALL_ENTITY_CLS)
-def test_entity_load_raises_on_load_error(mock_plugin, entity_cls_name,
+@mark.parametrize('entity_cls', ENTITY_CLASSES, ids=ALL_ENTITY_CLS)
+def test_entity_load_raises_on_load_error(mock_plugin, entity_cls,
                                           mock_not_found_error,
                                           mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import EntityNotFoundError
-    entity_cls = get_entity_cls(entity_cls_name)
     model = entity_cls.generate_model(model_cls=LazyLoadableModel)
     entity = entity_cls(model, mock_plugin)
     entity.persist_id = mock_entity_create_id
@@ -467,19 +511,17 @@ def test_entity_load_raises_on_load_error(mock_plugin, entity_cls_name,
         entity.load()
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_has_no_current_owner_if_not_persisted(mock_plugin, entity_name,
-                                                      request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('entity', ALL_ENTITIES, indirect=True, ids=ALL_ENTITY_CLS)
+def test_entity_has_no_current_owner_if_not_persisted(mock_plugin, entity):
     current_owner = entity.current_owner
     assert current_owner is None
     mock_plugin.get_history.assert_not_called()
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_current_owner(mock_plugin, alice_user, bob_user, entity_name,
-                              mock_entity_create_id, request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
+def test_entity_current_owner(mock_plugin, alice_user, bob_user,
+                              mock_entity_create_id, persisted_entity):
     mock_history = [{
         'user': alice_user,
         'event_id': mock_entity_create_id,
@@ -488,43 +530,33 @@ def test_entity_current_owner(mock_plugin, alice_user, bob_user, entity_name,
         'event_id': mock_entity_create_id,
     }]
 
-    entity.persist_id = mock_entity_create_id
-
     # Test current owner returned
     mock_plugin.get_history.return_value = mock_history
-    current_owner = entity.current_owner
-    assert mock_plugin.get_history.call_count == 1
+    current_owner = persisted_entity.current_owner
+    mock_plugin.get_history.assert_called_once_with(mock_entity_create_id)
     assert current_owner == bob_user
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
 def test_entity_current_owner_raises_if_not_found(mock_plugin, alice_user,
-                                                  entity_name,
-                                                  mock_entity_create_id,
-                                                  request):
-    from coalaip.exceptions import EntityNotFoundError
-    entity = request.getfixturevalue(entity_name)
-
-    entity.persist_id = mock_entity_create_id
-
+                                                  persisted_entity):
     mock_plugin.get_history.side_effect = EntityNotFoundError()
     with raises(EntityNotFoundError):
-        entity.current_owner
+        persisted_entity.current_owner
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_has_no_history_if_not_persisted(mock_plugin, entity_name,
-                                                request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('entity', ALL_ENTITIES, indirect=True, ids=ALL_ENTITY_CLS)
+def test_entity_has_no_history_if_not_persisted(mock_plugin, entity):
     history = entity.history
     assert history == []
     mock_plugin.get_history.assert_not_called()
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_history(mock_plugin, alice_user, bob_user, entity_name,
-                        mock_entity_create_id, request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
+def test_entity_history(mock_plugin, alice_user, bob_user,
+                        mock_entity_create_id, persisted_entity):
     mock_history = [{
         'user': alice_user,
         'event_id': mock_entity_create_id,
@@ -533,83 +565,62 @@ def test_entity_history(mock_plugin, alice_user, bob_user, entity_name,
         'event_id': mock_entity_create_id,
     }]
 
-    entity.persist_id = mock_entity_create_id
-
     # Test history is returned with the same events
     mock_plugin.get_history.return_value = mock_history
-    returned_history = entity.history
-    assert mock_plugin.get_history.call_count == 1
+    returned_history = persisted_entity.history
+    mock_plugin.get_history.assert_called_once_with(mock_entity_create_id)
 
     for returned_event, original_event in zip(returned_history, mock_history):
         assert returned_event == original_event
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
 def test_entity_history_raises_if_not_found(mock_plugin, alice_user,
-                                            entity_name, mock_entity_create_id,
-                                            request):
-    from coalaip.exceptions import EntityNotFoundError
-    entity = request.getfixturevalue(entity_name)
-
-    entity.persist_id = mock_entity_create_id
-
+                                            persisted_entity):
     mock_plugin.get_history.side_effect = EntityNotFoundError()
     with raises(EntityNotFoundError):
-        entity.history
+        persisted_entity.history
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_have_none_status_if_not_persisted(mock_plugin, entity_name,
-                                                  request):
-    entity = request.getfixturevalue(entity_name)
+@mark.parametrize('entity', ALL_ENTITIES, indirect=True, ids=ALL_ENTITY_CLS)
+def test_entity_have_none_status_if_not_persisted(mock_plugin, entity):
     status = entity.status
     assert status is None
     mock_plugin.get_status.assert_not_called()
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
-def test_entity_get_status(mock_plugin, alice_user, entity_name,
-                           mock_entity_create_id, mock_entity_status, request):
-    entity = request.getfixturevalue(entity_name)
-
-    entity.persist_id = mock_entity_create_id
-
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
+def test_entity_get_status(mock_plugin, alice_user, mock_entity_status,
+                           mock_entity_create_id, persisted_entity):
     # Test status returned
     mock_plugin.get_status.return_value = mock_entity_status
-    status = entity.status
-    assert mock_plugin.get_status.call_count == 1
+    status = persisted_entity.status
+    mock_plugin.get_status.assert_called_once_with(mock_entity_create_id)
     assert status == mock_entity_status
 
 
-@mark.parametrize('entity_name', ALL_ENTITIES)
+@mark.parametrize('persisted_entity', ALL_ENTITIES, indirect=True,
+                  ids=ALL_ENTITY_CLS)
 def test_entity_status_raises_if_not_found(mock_plugin, alice_user,
-                                           entity_name, mock_entity_create_id,
-                                           request):
-    from coalaip.exceptions import EntityNotFoundError
-    entity = request.getfixturevalue(entity_name)
-
-    entity.persist_id = mock_entity_create_id
-
+                                           persisted_entity):
     mock_plugin.get_status.side_effect = EntityNotFoundError()
     with raises(EntityNotFoundError):
-        entity.status
+        persisted_entity.status
 
 
-@mark.parametrize('entity_name', [
+@mark.parametrize('entity', [
     'work_entity',
     'manifestation_entity',
     'rights_assignment_entity',
-])
-def test_non_transferrable_entity_actually_non_transferrable(entity_name,
-                                                             request):
-    entity = request.getfixturevalue(entity_name)
+], indirect=True, ids=['Work', 'Manifestation', 'RightsAssignment'])
+def test_non_transferrable_entity_actually_non_transferrable(entity):
     with raises(AttributeError):
         entity.transfer()
 
 
 def test_work_init_from_data_raises_if_no_name(mock_plugin, work_data):
-    from coalaip.entities import Work
-    from coalaip.exceptions import ModelDataError
 
     del work_data['name']
     with raises(ModelDataError):
@@ -617,19 +628,13 @@ def test_work_init_from_data_raises_if_no_name(mock_plugin, work_data):
 
 
 def test_work_init_from_data_raises_if_manifestation(mock_plugin, work_data):
-    from copy import copy
-    from coalaip.entities import Work
-    from coalaip.exceptions import ModelDataError
 
-    manifestation_of_data = copy(work_data)
-    manifestation_of_data['manifestationOfWork'] = {}
+    manifestation_of_data = {**work_data, 'manifestationOfWork': {}}
     with raises(ModelDataError):
         Work.from_data(manifestation_of_data, plugin=mock_plugin)
 
 
 def test_manifestation_init_raises_if_no_name(mock_plugin, manifestation_data):
-    from coalaip.entities import Manifestation
-    from coalaip.exceptions import ModelDataError
     del manifestation_data['name']
     with raises(ModelDataError):
         Manifestation.from_data(manifestation_data, plugin=mock_plugin)
@@ -638,8 +643,6 @@ def test_manifestation_init_raises_if_no_name(mock_plugin, manifestation_data):
 @mark.skip(reason="We decided to go with Manifestation's that do not need works to be registered.")
 def test_manifestation_init_raises_without_manifestation_of_work(
         mock_plugin, manifestation_data):
-    from coalaip.entities import Manifestation
-    from coalaip.exceptions import ModelDataError
     del manifestation_data['manifestationOfWork']
     with raises(ModelDataError):
         Manifestation.from_data(manifestation_data, plugin=mock_plugin)
@@ -648,57 +651,50 @@ def test_manifestation_init_raises_without_manifestation_of_work(
 @mark.skip(reason="We decided to go with Manifestation's that do not need works to be registered.")
 def test_manifestation_init_raises_without_str_manifestation_of_work(
         mock_plugin, manifestation_data):
-    from coalaip.entities import Manifestation
-    from coalaip.exceptions import ModelDataError
     manifestation_data['manifestationOfWork'] = {}
     with raises(ModelDataError):
         Manifestation.from_data(manifestation_data, plugin=mock_plugin)
 
 
-def test_right_init_raises_without_str_source(mock_plugin, right_data):
-    from coalaip.entities import Right
-    from coalaip.exceptions import ModelDataError
-
-    del right_data['source']
-    with raises(ModelDataError):
-        Right.from_data(right_data, plugin=mock_plugin)
+@mark.parametrize('source', [None, {}], ids=['missing', 'non-str'])
+def test_right_init_raises_without_str_source(mock_plugin, right_data,
+                                              source):
+    if source is None:
+        del right_data['source']
+    else:
+        right_data['source'] = source
 
-    right_data['source'] = {}
     with raises(ModelDataError):
         Right.from_data(right_data, plugin=mock_plugin)
 
 
-def test_right_init_raises_without_str_license(mock_plugin, right_data):
-    from coalaip.entities import Right
-    from coalaip.exceptions import ModelDataError
-
-    del right_data['license']
-    with raises(ModelDataError):
-        Right.from_data(right_data, plugin=mock_plugin)
+@mark.parametrize('license', [None, {}], ids=['missing', 'non-str'])
+def test_right_init_raises_without_str_license(mock_plugin, right_data,
+                                               license):
+    if license is None:
+        del right_data['license']
+    else:
+        right_data['license'] = license
 
-    right_data['license'] = {}
     with raises(ModelDataError):
         Right.from_data(right_data, plugin=mock_plugin)
 
 
+@mark.parametrize('rights_of', [None, {}], ids=['missing', 'non-str'])
 def test_copyright_init_raises_without_str_rights_of(mock_plugin,
-                                                     copyright_data):
-    from coalaip.entities import Copyright
-    from coalaip.exceptions import ModelDataError
-
-    del copyright_data['rightsOf']
-    with raises(ModelDataError):
-        Copyright.from_data(copyright_data, plugin=mock_plugin)
+                                                     copyright_data,
+                                                     rights_of):
+    if rights_of is None:
+        del copyright_data['rightsOf']
+    else:
+        copyright_data['rightsOf'] = rights_of
 
-    copyright_data['rightsOf'] = {}
     with raises(ModelDataError):
         Copyright.from_data(copyright_data, plugin=mock_plugin)
 
 
 def test_copyright_init_raises_if_derived(mock_plugin, right_data,
                                           mock_copyright_create_id):
-    from coalaip.entities import Copyright
-    from coalaip.exceptions import ModelDataError
 
     copyright_data = right_data
     assert copyright_data['source']
@@ -706,41 +702,30 @@ def test_copyright_init_raises_if_derived(mock_plugin, right_data,
         Copyright.from_data(copyright_data, plugin=mock_plugin)
 
 
-@mark.parametrize('entity_cls_name', ['Right', 'Copyright'])
+@mark.parametrize('entity_cls', [Right, Copyright],
+                  ids=['Right', 'Copyright'])
 def test_right_init_raises_if_both_copyright_and_right(
-        mock_plugin, entity_cls_name, copyright_data, right_data):
-    from coalaip.exceptions import ModelDataError
-    from tests.utils import extend_dict
-    entity_cls = get_entity_cls(entity_cls_name)
-
+        mock_plugin, entity_cls, copyright_data, right_data):
     data = extend_dict(right_data, copyright_data)
     with raises(ModelDataError):
         entity_cls.from_data(data, plugin=mock_plugin)
 
 
-@mark.parametrize('right_entity_name,mock_create_id_name', [
-    ('right_entity', 'mock_right_create_id'),
-    ('copyright_entity', 'mock_copyright_create_id'),
-])
-@mark.parametrize('use_data_format_enum', [True, False])
+@mark.parametrize('persisted_right', PERSISTED_RIGHT_PARAMS, indirect=True,
+                  ids=['right', 'copyright'])
 @mark.parametrize('data_format,rights_assignment_saved_data_name', [
     ('', 'rights_assignment_jsonld'),
     ('json', 'rights_assignment_json'),
     ('jsonld', 'rights_assignment_jsonld'),
-    mark.skip(('ipld', 'rights_assignment_ipld')),
-])
+    param('ipld', 'rights_assignment_ipld',
+          marks=mark.skip(reason='ipld is not yet supported')),
+], ids=['default', 'json', 'jsonld', 'ipld'])
 def test_right_transferrable(mock_plugin, alice_user, bob_user,
-                             rights_assignment_data, right_entity_name,
-                             mock_create_id_name, data_format,
+                             rights_assignment_data, data_format,
                              rights_assignment_saved_data_name,
-                             use_data_format_enum,
-                             mock_rights_assignment_transfer_id, request):
-    right_entity = request.getfixturevalue(right_entity_name)
-    mock_create_id = request.getfixturevalue(mock_create_id_name)
-
-    # Save the Copyright
-    mock_plugin.save.return_value = mock_create_id
-    right_entity.create(user=alice_user)
+                             mock_rights_assignment_transfer_id,
+                             persisted_right, request):
+    right_entity, mock_create_id = persisted_right
 
     # Set up the arguments
     mock_plugin.transfer.return_value = mock_rights_assignment_transfer_id
@@ -749,9 +734,6 @@ def test_right_transferrable(mock_plugin, alice_user, bob_user,
         'to_user': bob_user
     }
     if data_format:
-        if use_data_format_enum:
-            from tests.utils import get_data_format_enum_member
-            data_format = get_data_format_enum_member(data_format)
         transfer_kwargs['rights_assignment_format'] = data_format
 
     # Test the transfer
@@ -768,12 +750,12 @@ def test_right_transferrable(mock_plugin, alice_user, bob_user,
                                             to_user=bob_user)
 
 
-@mark.parametrize('right_entity_name', ['right_entity', 'copyright_entity'])
+@mark.parametrize('entity', ['right_entity', 'copyright_entity'],
+                  indirect=True, ids=['Right', 'Copyright'])
 def test_right_transfer_raises_if_not_persisted(alice_user, bob_user,
                                                 rights_assignment_data,
-                                                right_entity_name, request):
-    from coalaip.exceptions import EntityNotYetPersistedError
-    right_entity = request.getfixturevalue(right_entity_name)
+                                                entity):
+    right_entity = entity
 
     with raises(EntityNotYetPersistedError):
         right_entity.transfer(rights_assignment_data, from_user=alice_user,
@@ -781,30 +763,20 @@ def test_right_transfer_raises_if_not_persisted(alice_user, bob_user,
 
 
 def test_rights_assignment_cannot_create(rights_assignment_entity, alice_user):
-    from coalaip.exceptions import PersistenceError
     with raises(PersistenceError):
         rights_assignment_entity.create(user=alice_user)
 
 
-@mark.parametrize('right_entity_name,right_create_id_name', [
-    ('right_entity', 'mock_right_create_id'),
-    ('copyright_entity', 'mock_copyright_create_id'),
-])
+@mark.parametrize('persisted_right', PERSISTED_RIGHT_PARAMS, indirect=True,
+                  ids=['right', 'copyright'])
 def test_right_transfer_raises_on_transfer_error(mock_plugin, alice_user,
-                                                 bob_user, right_entity_name,
-                                                 right_create_id_name,
+                                                 bob_user,
                                                  rights_assignment_data,
                                                  mock_transfer_error,
-                                                 request):
-    from coalaip.exceptions import EntityTransferError
+                                                 persisted_right):
+    right_entity, _ = persisted_right
     mock_plugin.transfer.side_effect = mock_transfer_error
 
-    # Save the right
-    mock_create_id = request.getfixturevalue(right_create_id_name)
-    right_entity = request.getfixturevalue(right_entity_name)
-    mock_plugin.save.return_value = mock_create_id
-    right_entity.create(user=alice_user)
-
     with raises(EntityTransferError) as excinfo:
         right_entity.transfer(rights_assignment_data, from_user=alice_user,
                               to_user=bob_user)
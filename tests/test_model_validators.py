@@ -3,6 +3,20 @@ import attr
 from pytest import fixture, mark, raises
 
 
+class RecordingCallable:
+    """Cheap stand-in for a ``Mock`` validator that just records the
+    calls it receives (and optionally raises)."""
+
+    def __init__(self, side_effect=None):
+        self.calls = []
+        self.side_effect = side_effect
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+
+
 @fixture
 def test_is_callable_cls():
     from coalaip.model_validators import is_callable
@@ -53,24 +67,22 @@ def test_is_callable_raises_on_non_callable(test_is_callable_cls):
         test_is_callable_cls('fn')
 
 
-def test_use_model_attr(mocker, test_use_model_attr_cls):
-    validator_mock = mocker.Mock()
+def test_use_model_attr(test_use_model_attr_cls):
+    validator = RecordingCallable()
     test_val = 'test'
 
-    test_use_model_attr_cls(validator=validator_mock, test=test_val)
-    assert validator_mock.call_count == 1
+    test_use_model_attr_cls(validator=validator, test=test_val)
+    assert len(validator.calls) == 1
     # Check positional 'value' arg of validator
-    assert validator_mock.call_args[0][-1] == test_val
+    assert validator.calls[0][0][-1] == test_val
 
 
-def test_use_model_attr_raises_if_validator_raises(mocker,
-                                                   test_use_model_attr_cls):
-    validator_mock = mocker.Mock()
-    validator_mock.side_effect = TypeError()
+def test_use_model_attr_raises_if_validator_raises(test_use_model_attr_cls):
+    validator = RecordingCallable(side_effect=TypeError())
     test_val = 'test'
 
     with raises(TypeError):
-        test_use_model_attr_cls(validator=validator_mock, test=test_val)
+        test_use_model_attr_cls(validator=validator, test=test_val)
 
 
 def test_does_not_contain(create_test_does_not_contain_cls):
@@ -1,15 +1,28 @@
 #!/usr/bin/env python
 
-from pytest import fixture, mark, raises
+from collections.abc import Mapping
 from copy import copy
 
+from attr import validators
+from attr.exceptions import FrozenInstanceError
+from pytest import fixture, mark, raises
 
-@fixture
+from coalaip import models
+from coalaip.exceptions import ModelDataError, ModelNotYetLoadedError
+from coalaip.model_validators import is_creation_model
+from coalaip.models import LazyLoadableModel, Model
+from tests.utils import assert_key_values_present_in_dict
+
+
+# The model fixtures are never mutated by the tests (the immutability
+# tests poke at the model wrappers, and models copy their given data),
+# so a single instance can be shared across the whole module
+@fixture(scope='module')
 def model_data():
     return {'data': 'data'}
 
 
-@fixture
+@fixture(scope='module')
 def model_jsonld(model_data, model_type, model_id, model_context):
     model_jsonld = copy(model_data)
     model_jsonld['@type'] = model_type
@@ -18,79 +31,104 @@ def model_jsonld(model_data, model_type, model_id, model_context):
     return model_jsonld
 
 
-@fixture
+@fixture(scope='module')
 def model_type():
     return 'model_ld_type'
 
 
-@fixture
+@fixture(scope='module')
 def model_id():
     return 'model_ld_id'
 
 
-@fixture
+@fixture(scope='module')
 def model_context():
     return 'model_ld_context'
 
 
-def test_model_init(model_data, model_type):
-    from coalaip.models import Model
+MODEL_CLASSES = (Model, LazyLoadableModel)
+MODEL_CLASS_IDS = ('Model', 'LazyLoadableModel')
+
+# instance_of() builds a new validator object each call; one shared
+# instance is enough for the immutability checks
+INSTANCE_OF_STR = validators.instance_of(str)
+
+
+@mark.parametrize('model_cls', MODEL_CLASSES, ids=MODEL_CLASS_IDS)
+def test_model_init(model_data, model_type, model_cls):
     ld_context = 'ld_context'
 
     def validator(instance, attribute, value):
         if not value.get('data'):
             raise ValueError()
 
-    model = Model(data=model_data, ld_type=model_type, ld_context=ld_context,
-                  validator=validator)
+    model = model_cls(data=model_data, ld_type=model_type,
+                      ld_context=ld_context, validator=validator)
     assert model.data == model_data
     assert model.ld_type == model_type
     assert model.ld_context == ld_context
     assert model.validator == validator
 
 
-def test_model_init_defaults(context_urls_all, model_data, model_type):
-    from coalaip.models import Model
-    model = Model(data=model_data, ld_type=model_type)
-    assert model.data == model_data
+@mark.parametrize('model_cls', MODEL_CLASSES, ids=MODEL_CLASS_IDS)
+def test_model_init_defaults(context_urls_all_frozen, model_data, model_type,
+                             model_cls):
+    # A LazyLoadableModel can be created without any data; its
+    # loaded_model stays empty until load()
+    if model_cls is LazyLoadableModel:
+        model = model_cls(ld_type=model_type)
+        assert model.loaded_model is None
+    else:
+        model = model_cls(data=model_data, ld_type=model_type)
+        assert model.data == model_data
     assert model.ld_type == model_type
-    assert set(model.ld_context) == set(context_urls_all)
+    assert frozenset(model.ld_context) == context_urls_all_frozen
     assert callable(model.validator)
 
 
-def test_model_immutable(model_data, model_type):
-    from attr import validators
-    from attr.exceptions import FrozenInstanceError
-    from coalaip.models import Model
-    model = Model(data=model_data, ld_type=model_type)
-    with raises(FrozenInstanceError):
-        model.data = {'other': 'other'}
+@mark.parametrize('model_cls', MODEL_CLASSES, ids=MODEL_CLASS_IDS)
+def test_model_immutable(model_data, model_type, model_cls):
+    model = model_cls(data=model_data, ld_type=model_type)
+    if isinstance(model, LazyLoadableModel):
+        with raises(FrozenInstanceError):
+            model.loaded_model = Model(data={'other': 'other'},
+                                       ld_type='other_type')
+    else:
+        with raises(FrozenInstanceError):
+            model.data = {'other': 'other'}
     with raises(FrozenInstanceError):
         model.ld_type = 'other_type'
     with raises(FrozenInstanceError):
         model.ld_context = 'other_context'
     with raises(FrozenInstanceError):
-        model.validator = validators.instance_of(str)
+        model.validator = INSTANCE_OF_STR
 
 
-def test_model_data_immutable(model_data, model_type):
-    from coalaip.models import Model
-    model = Model(data=model_data, ld_type=model_type)
+@mark.parametrize('model_cls', MODEL_CLASSES, ids=MODEL_CLASS_IDS)
+def test_model_data_immutable(mock_plugin, model_data, model_type,
+                              mock_entity_create_id, model_cls):
+    if model_cls is LazyLoadableModel:
+        mock_plugin.load.return_value = model_data
+        model = model_cls(ld_type=model_type)
+        model.load(mock_entity_create_id, plugin=mock_plugin)
+    else:
+        model = model_cls(data=model_data, ld_type=model_type)
     with raises(TypeError):
         model.data['new_data'] = 'new_data'
     assert model.data == model_data
 
 
+@mark.parametrize('model_cls', MODEL_CLASSES, ids=MODEL_CLASS_IDS)
 @mark.parametrize('ld_context', [
     'context',
     ['array', 'for', 'context'],
     {'a': 'dict', 'for': 'context'},
     [{'mixed': 'array'}, 'for', 'context'],
 ])
-def test_model_ld_context_immutable(model_data, model_type, ld_context):
-    from collections import Mapping
-    from coalaip.models import Model
-    model = Model(data=model_data, ld_type=model_type, ld_context=ld_context)
+def test_model_ld_context_immutable(model_data, model_type, ld_context,
+                                    model_cls):
+    model = model_cls(data=model_data, ld_type=model_type,
+                      ld_context=ld_context)
     if isinstance(ld_context, str):
         with raises(TypeError):
             model.ld_context[0] = 'a'
@@ -102,32 +140,8 @@ def test_model_ld_context_immutable(model_data, model_type, ld_context):
             model.ld_context[0] = 'new_context'
 
 
-def test_lazy_model_init(model_type):
-    from attr import validators
-    from coalaip.models import LazyLoadableModel
-    ld_context = 'ld_context'
-    validator = validators.instance_of(dict)
-
-    model = LazyLoadableModel(ld_type=model_type, ld_context=ld_context,
-                              validator=validator)
-    assert model.loaded_model is None
-    assert model.ld_type == model_type
-    assert model.ld_context == ld_context
-    assert model.validator == validator
-
-
-def test_lazy_model_init_defaults(context_urls_all, model_type):
-    from coalaip.models import LazyLoadableModel
-    model = LazyLoadableModel(ld_type=model_type)
-    assert model.loaded_model is None
-    assert model.ld_type == model_type
-    assert set(model.ld_context) == set(context_urls_all)
-    assert callable(model.validator)
-
-
 def test_lazy_model_init_with_data(mock_plugin, model_data, model_type,
                                    mock_entity_create_id):
-    from coalaip.models import Model, LazyLoadableModel
     model = LazyLoadableModel(data=model_data, ld_type=model_type)
     assert model.data == model_data
     assert isinstance(model.loaded_model, Model)
@@ -141,88 +155,45 @@ def test_lazy_model_init_with_data(mock_plugin, model_data, model_type,
     mock_plugin.load.assert_not_called()
 
 
-def test_lazy_model_raises_on_data_access_before_load(model_type):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import ModelNotYetLoadedError
-    model = LazyLoadableModel(ld_type=model_type)
-    with raises(ModelNotYetLoadedError):
-        model.data
+@fixture(scope='module')
+def bare_lazy_model(model_type):
+    # An unloaded LazyLoadableModel shared by the tests that only check
+    # behaviour before load(); none of them load or mutate it
+    return LazyLoadableModel(ld_type=model_type)
 
 
-def test_lazy_model_raises_on_ld_id_access_before_load(model_type):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import ModelNotYetLoadedError
-    model = LazyLoadableModel(ld_type=model_type)
+def test_lazy_model_raises_on_data_access_before_load(bare_lazy_model):
     with raises(ModelNotYetLoadedError):
-        model.ld_id
-
-
-def test_lazy_model_immutable(model_data, model_type):
-    from attr import validators
-    from attr.exceptions import FrozenInstanceError
-    from coalaip.models import Model, LazyLoadableModel
-    model = LazyLoadableModel(data=model_data, ld_type=model_type)
-    with raises(FrozenInstanceError):
-        model.loaded_model = Model(data={'other': 'other'}, ld_type='other_type')
-    with raises(FrozenInstanceError):
-        model.ld_type = 'other_type'
-    with raises(FrozenInstanceError):
-        model.ld_context = 'other_context'
-    with raises(FrozenInstanceError):
-        model.validator = validators.instance_of(str)
+        bare_lazy_model.data
 
 
-@mark.parametrize('ld_context', [
-    'context',
-    ['array', 'for', 'context'],
-    {'a': 'dict', 'for': 'context'},
-    [{'mixed': 'array'}, 'for', 'context'],
-])
-def test_lazy_model_ld_context_immutable(model_type, ld_context):
-    from collections import Mapping
-    from coalaip.models import LazyLoadableModel
-    model = LazyLoadableModel(ld_type=model_type, ld_context=ld_context)
-    if isinstance(ld_context, str):
-        with raises(TypeError):
-            model.ld_context[0] = 'a'
-    elif isinstance(ld_context, Mapping):
-        with raises(TypeError):
-            model.ld_context['new_key'] = 'new_data'
-    else:
-        with raises(TypeError):
-            model.ld_context[0] = 'new_context'
-
-
-def test_lazy_model_load(mock_plugin, model_data, model_type,
-                         mock_entity_create_id):
-    from coalaip.models import Model, LazyLoadableModel
-    mock_plugin.load.return_value = model_data
-
-    model = LazyLoadableModel(ld_type=model_type)
-    model.load(mock_entity_create_id, plugin=mock_plugin)
-    mock_plugin.load.assert_called_with(mock_entity_create_id)
-    assert model.data == model_data
-    assert isinstance(model.loaded_model, Model)
-    assert model.loaded_model.data == model_data
-    assert model.loaded_model.ld_type == model.ld_type
-    assert model.loaded_model.ld_id == model.ld_id
-    assert model.loaded_model.ld_context == model.ld_context
-    assert model.loaded_model.validator == model.validator
-
-    # If initialized with data, load() becomes a noop
-    mock_plugin.reset_mock()
-    model.load(mock_entity_create_id, plugin=mock_plugin)
-    mock_plugin.load.assert_not_called()
-
+def test_lazy_model_raises_on_ld_id_access_before_load(bare_lazy_model):
+    with raises(ModelNotYetLoadedError):
+        bare_lazy_model.ld_id
 
-def test_lazy_model_load_jsonld(mock_plugin, model_data, model_jsonld,
-                                model_type, model_context,
-                                mock_entity_create_id):
-    from coalaip.models import Model, LazyLoadableModel
-    mock_plugin.load.return_value = model_jsonld
 
-    model = LazyLoadableModel(ld_type=model_type, ld_context=model_context)
-    model.load(mock_entity_create_id, plugin=mock_plugin)
+@fixture
+def loaded_lazy_model_factory(mock_plugin, model_type, mock_entity_create_id):
+    # Configures the plugin, builds the model, and loads it in one shot
+    # for the tests that start from an already-loaded lazy model
+    def factory(loaded_data, **kwargs):
+        mock_plugin.load.return_value = loaded_data
+        model = LazyLoadableModel(ld_type=model_type, **kwargs)
+        model.load(mock_entity_create_id, plugin=mock_plugin)
+        return model
+    return factory
+
+
+@mark.parametrize('loaded_data_name', ['model_data', 'model_jsonld'],
+                  ids=['json', 'jsonld'])
+def test_lazy_model_load(mock_plugin, model_data, model_context,
+                         mock_entity_create_id, loaded_lazy_model_factory,
+                         loaded_data_name, request):
+    kwargs = {}
+    if loaded_data_name == 'model_jsonld':
+        kwargs['ld_context'] = model_context
+    model = loaded_lazy_model_factory(
+        request.getfixturevalue(loaded_data_name), **kwargs)
     mock_plugin.load.assert_called_with(mock_entity_create_id)
     assert model.data == model_data
     assert isinstance(model.loaded_model, Model)
@@ -238,33 +209,14 @@ def test_lazy_model_load_jsonld(mock_plugin, model_data, model_jsonld,
     mock_plugin.load.assert_not_called()
 
 
-def test_lazy_model_immutable_after_load(mock_plugin, model_data, model_type,
-                                         mock_entity_create_id):
-    from attr.exceptions import FrozenInstanceError
-    from coalaip.models import Model, LazyLoadableModel
-    mock_plugin.load.return_value = model_data
-
-    model = LazyLoadableModel(ld_type=model_type)
-    model.load(mock_entity_create_id, plugin=mock_plugin)
+def test_lazy_model_immutable_after_load(model_data,
+                                         loaded_lazy_model_factory):
+    model = loaded_lazy_model_factory(model_data)
 
     with raises(FrozenInstanceError):
         model.loaded_model = Model(data={'other': 'other'}, ld_type='other_type')
 
 
-def test_lazy_model_data_immutable_after_load(mock_plugin, model_data,
-                                              model_type,
-                                              mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
-    mock_plugin.load.return_value = model_data
-
-    model = LazyLoadableModel(ld_type=model_type)
-    model.load(mock_entity_create_id, plugin=mock_plugin)
-
-    with raises(TypeError):
-        model.data['new_data'] = 'new_data'
-    assert model.data == model_data
-
-
 @mark.parametrize('bad_type_data', [
     {'@type': 'other_type'},
     {'type': 'other_type'},
@@ -272,8 +224,6 @@ def test_lazy_model_data_immutable_after_load(mock_plugin, model_data,
 def test_lazy_model_load_raises_on_type_validation(mock_plugin, model_type,
                                                    bad_type_data,
                                                    mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import ModelDataError
     mock_plugin.load.return_value = bad_type_data
     assert model_type != (bad_type_data.get('@type') or
                           bad_type_data.get('type'))
@@ -287,8 +237,6 @@ def test_lazy_model_load_raises_on_context_validation(mock_plugin,
                                                       context_urls_all,
                                                       model_type,
                                                       mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.exceptions import ModelDataError
     bad_context_data = {'@context': 'other_context'}
     mock_plugin.load.return_value = bad_context_data
     assert context_urls_all != bad_context_data.get('@context')
@@ -302,9 +250,6 @@ def test_lazy_model_load_raises_on_model_validation(mock_plugin, work_jsonld,
                                                     right_jsonld_factory,
                                                     model_type,
                                                     mock_entity_create_id):
-    from coalaip.models import LazyLoadableModel
-    from coalaip.model_validators import is_creation_model
-    from coalaip.exceptions import ModelDataError
     mock_plugin.load.return_value = right_jsonld_factory()
 
     model = LazyLoadableModel(ld_type=model_type, validator=is_creation_model)
@@ -312,33 +257,43 @@ def test_lazy_model_load_raises_on_model_validation(mock_plugin, work_jsonld,
         model.load(mock_entity_create_id, plugin=mock_plugin)
 
 
-@mark.parametrize('model_factory_name,data_name,jsonld_name', [
+MODEL_FACTORY_FIXTURES = (
     ('work_model_factory', 'work_data', 'work_jsonld'),
     ('manifestation_model_factory', 'manifestation_data', 'manifestation_jsonld'),
     ('copyright_model_factory', 'copyright_data', 'copyright_jsonld'),
     ('right_model_factory', 'right_data', 'right_jsonld'),
     ('rights_assignment_model_factory', 'rights_assignment_data', 'rights_assignment_jsonld'),
-])
-@mark.parametrize('model_cls_name', ['Model', 'LazyLoadableModel'])
-def test_model_factories(model_factory_name, data_name, jsonld_name,
-                         model_cls_name, request):
-    import importlib
-    from collections import Mapping
-    from tests.utils import assert_key_values_present_in_dict
-
-    models = importlib.import_module('coalaip.models')
-    model_factory = getattr(models, model_factory_name)
-    model_cls = getattr(models, model_cls_name)
-
-    data = request.getfixturevalue(data_name)
-    jsonld = request.getfixturevalue(jsonld_name)
-
-    model = model_factory(data=data, model_cls=model_cls)
-    assert_key_values_present_in_dict(model.data, **data)
-    assert model.ld_type == jsonld['@type']
-    if isinstance(model.ld_context, str):
-        assert model.ld_context == jsonld['@context']
-    elif isinstance(model.ld_context, Mapping):
-        assert dict(model.ld_context) == dict(jsonld['@context'])
-    else:
-        assert set(model.ld_context) == set(jsonld['@context'])
+)
+
+
+def test_model_factories(request):
+    # The factories share one body, so looping amortizes the per-test
+    # setup over all five instead of paying it per parametrize row.
+    # Only Model is exercised here: a LazyLoadableModel built by a
+    # factory delegates to an inner Model, covered by the test below
+    for model_factory_name, data_name, jsonld_name in MODEL_FACTORY_FIXTURES:
+        model_factory = getattr(models, model_factory_name)
+
+        data = request.getfixturevalue(data_name)
+        jsonld = request.getfixturevalue(jsonld_name)
+
+        model = model_factory(data=data, model_cls=Model)
+        assert_key_values_present_in_dict(model.data, **data)
+        assert model.ld_type == jsonld['@type']
+        if isinstance(model.ld_context, str):
+            assert model.ld_context == jsonld['@context']
+        elif isinstance(model.ld_context, Mapping):
+            assert dict(model.ld_context) == dict(jsonld['@context'])
+        else:
+            assert set(model.ld_context) == set(jsonld['@context'])
+
+
+def test_lazy_model_factory_delegates(work_data):
+    lazy = models.work_model_factory(data=work_data,
+                                     model_cls=LazyLoadableModel)
+    direct = models.work_model_factory(data=work_data, model_cls=Model)
+
+    assert isinstance(lazy.loaded_model, Model)
+    assert lazy.data == direct.data
+    assert lazy.ld_type == direct.ld_type
+    assert lazy.ld_context == direct.ld_context
@@ -1,10 +1,10 @@
+from attr.exceptions import FrozenInstanceError
 from pytest import raises
 
+from coalaip.utils import PostInitImmutable
 
-def test_post_init_immutable():
-    from attr.exceptions import FrozenInstanceError
-    from coalaip.utils import PostInitImmutable
 
+def test_post_init_immutable():
     class Immutable(PostInitImmutable):
         def __init__(self, attr1):
             self.attr1 = attr1
@@ -1,27 +1,71 @@
+from functools import lru_cache
+from unittest.mock import Mock
+
+from coalaip.data_formats import DataFormat
+from coalaip.plugin import AbstractPlugin
+
+
+PLUGIN_METHOD_NAMES = (
+    'generate_user',
+    'get_history',
+    'get_status',
+    'is_same_user',
+    'load',
+    'save',
+    'transfer',
+)
+
+
+class StubPlugin:
+    """Lightweight stand-in for a persistence layer plugin.
+
+    Much cheaper to instantiate than a mock spec'd against
+    :class:`~.AbstractPlugin`, while each plugin method is still exposed
+    as a plain :class:`~unittest.mock.Mock` so tests can keep using the
+    usual configuration and assertion helpers.
+    """
+
+    def __init__(self):
+        self.type = 'mock'
+        for method_name in PLUGIN_METHOD_NAMES:
+            setattr(self, method_name, Mock())
+
+    def reset_mock(self):
+        for method_name in PLUGIN_METHOD_NAMES:
+            getattr(self, method_name).reset_mock()
+
+
+# Register as a virtual subclass so the plugins created by
+# `create_mock_plugin()` pass the `isinstance(plugin, AbstractPlugin)`
+# validation done by `CoalaIp` and the entities
+AbstractPlugin.register(StubPlugin)
+
+
 def create_mock_plugin():
-    from unittest.mock import Mock
-    from coalaip.plugin import AbstractPlugin
-    mock_plugin = Mock(
-        name="mock_ledger_plugin",
-        spec_set=AbstractPlugin)
-    mock_plugin.type = 'mock'
-    return mock_plugin
+    return StubPlugin()
 
 
+@lru_cache(maxsize=None)
 def create_entity_id_setter(work_id, manifestation_id, copyright_id,
                             type_key='@type'):
+    # Dispatch on the type with a table built once per (cached) factory
+    # call rather than a chain of string comparisons per save
+    ids_by_type = {
+        'AbstractWork': work_id,
+        'Copyright': copyright_id,
+    }
+
     def set_entity_id(entity_data, *args, **kwargs):
-        if entity_data[type_key] == 'AbstractWork':
-            return work_id
-        elif entity_data[type_key] == 'Copyright':
-            return copyright_id
-        elif entity_data.get('manifestationOfWork', False):
+        entity_id = ids_by_type.get(entity_data[type_key])
+        if entity_id is not None:
+            return entity_id
+        if entity_data.get('manifestationOfWork', False):
             return manifestation_id
     return set_entity_id
 
 
+@lru_cache(maxsize=None)
 def get_data_format_enum_member(data_format):
-    from coalaip.data_formats import DataFormat
     return DataFormat(data_format)
 
 
@@ -29,9 +73,7 @@ def get_data_format_enum_member(data_format):
 # Dict utils #
 ##############
 def assert_key_values_present_in_dict(check_dict, **kwargs):
-    from functools import reduce
-    assert reduce(lambda present, k: present and check_dict.get(k) == kwargs[k],
-                  kwargs, True)
+    assert kwargs.items() <= check_dict.items()
 
 
 # See http://stackoverflow.com/a/26853961/1375656
@@ -44,7 +86,9 @@ def extend_dict(x, *y):
         *y (dict, iter): any number of dictionary or iterable key/value
             pairs to be sequentially merged into 'x'. Skipped if None.
     """
-    z = x.copy()
-    for d in [d for d in y if d is not None]:
-        z.update(d)
+    z = dict(x)
+    for d in y:
+        # Merging something empty is a no-op, so skip it along with None
+        if d:
+            z.update(d)
     return z